@@ -11,42 +11,208 @@ __author__ = "Erik Bitzek"
 __project__ = "MatWerk Scholar Toolbox"
 
 import sys
+import os
 import subprocess
 import platform
+import queue
 import urllib.request
 import urllib.parse
 import urllib.error
+import urllib.response
+import http.client
+import copy
+import io
 import json
+import gzip
+import pickle
 import re
+import shutil
 import unicodedata
 import socket
+import sqlite3
 import ssl
-import certifi
+import threading
+import time
+import webbrowser
+from collections.abc import Mapping
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
 from typing import Optional, Dict, List, Tuple
 
-# Fix SSL certificates for PyInstaller bundles
-ssl_context = ssl.create_default_context(cafile=certifi.where())
+# Optional: orjson parses JSON bytes considerably faster than the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Host platform ('Darwin', 'Windows', 'Linux', ...), looked up once
+_SYSTEM = platform.system()
+
+
+@lru_cache(maxsize=None)
+def _get_ssl_context() -> ssl.SSLContext:
+    """
+    Return the shared SSL context, created on first use.
+    
+    Uses certifi's CA bundle (fixes SSL certificates for PyInstaller bundles).
+    Importing certifi and loading the bundle take a noticeable part of the
+    module's import time, so this waits until the first HTTPS request.
+    """
+    import certifi
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def __getattr__(name):
+    # Keep the public ``ssl_context`` attribute, now created lazily
+    if name == 'ssl_context':
+        return _get_ssl_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) needs Python 3.7; create it up front instead
+    ssl_context = _get_ssl_context()
+
+# JSON APIs that are queried repeatedly; connections to them are kept alive
+KEEP_ALIVE_HOSTS = ('api.crossref.org', 'api.unpaywall.org')
+
+# Idle connections kept open per host (enough for the lookup thread pools)
+_KEEP_ALIVE_MAX_IDLE = 8
+
+
+class _KeepAliveHTTPSHandler(urllib.request.HTTPSHandler):
+    """
+    HTTPS handler that reuses connections to the metadata APIs.
+    
+    urllib sets up a new TCP + TLS connection for every request. For the
+    hosts in KEEP_ALIVE_HOSTS a few idle connections are kept in a pool
+    shared by all threads instead. Response bodies are handed out unread;
+    a connection goes back to the pool once its response has been read to
+    the end and closed, and is closed otherwise. Other hosts use the
+    standard handler code path. Both use the context from get_context
+    (certifi's CA bundle), resolved on the first request.
+    """
+    
+    def __init__(self, get_context, hosts):
+        # The base class' own context is not used: from Python 3.12 on it
+        # defaults to the system store instead of staying None
+        super().__init__()
+        self._get_context = get_context
+        self._certifi_ctx = None
+        self._hosts = frozenset(hosts)
+        self._idle = {}
+        self._lock = threading.Lock()
+    
+    def https_open(self, req):
+        if self._certifi_ctx is None:
+            self._certifi_ctx = self._get_context()
+        context = self._certifi_ctx
+        host = req.host
+        if host not in self._hosts:
+            return self.do_open(http.client.HTTPSConnection, req, context=context)
+        
+        headers = dict(req.unredirected_hdrs)
+        headers.update((k, v) for k, v in req.headers.items() if k not in headers)
+        headers['Connection'] = 'keep-alive'
+        headers = {name.title(): value for name, value in headers.items()}
+        
+        while True:
+            conn = self._checkout(host)
+            reused = conn is not None
+            if conn is None:
+                conn = http.client.HTTPSConnection(host, timeout=req.timeout, context=context)
+            else:
+                conn.timeout = req.timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(req.timeout)
+            try:
+                conn.request(req.get_method(), req.selector, req.data, headers)
+                response = conn.getresponse()
+                if response.status >= 300:
+                    # Error and redirect bodies are small: read them now, so
+                    # the connection is free again right away
+                    body = response.read()
+                break
+            except OSError as e:
+                conn.close()
+                if reused and isinstance(e, ConnectionError):
+                    continue  # The server dropped the idle connection - use a fresh one
+                raise urllib.error.URLError(e)
+            except http.client.HTTPException:
+                conn.close()
+                if reused:
+                    continue
+                raise
+        
+        if response.status >= 300:
+            self._checkin(host, conn, response)
+            fp = io.BytesIO(body)
+        else:
+            fp = urllib.response.addclosehook(response, self._checkin, host, conn, response)
+        result = urllib.response.addinfourl(fp, response.msg, req.get_full_url(), response.status)
+        result.msg = response.reason
+        return result
+    
+    def _checkout(self, host):
+        """Take an idle connection to host from the pool, or None."""
+        with self._lock:
+            idle = self._idle.get(host)
+            return idle.pop() if idle else None
+    
+    def _checkin(self, host, conn, response):
+        """Put a connection back in the pool if its response was read to the end."""
+        if not response.will_close and response.isclosed():
+            with self._lock:
+                idle = self._idle.setdefault(host, [])
+                if len(idle) < _KEEP_ALIVE_MAX_IDLE:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+
+# Shared opener for all HTTP(S) requests, built once instead of per call
+_OPENER = urllib.request.build_opener(_KeepAliveHTTPSHandler(_get_ssl_context, KEEP_ALIVE_HOSTS))
+
+
+# Local cache for CrossRef responses and the parsed abbreviation database.
+# Set BIBTEXER_CACHE=ignore to bypass the cache, or =clear to empty it on start
+BIBTEXER_CACHE = os.environ.get('BIBTEXER_CACHE', '').lower()
+
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'bibtexer'
+)
+
+# Cached CrossRef records younger than this many days are used without asking
+# CrossRef at all; older ones are revalidated. Override with BIBTEXER_CACHE_TTL
+try:
+    CACHE_TTL_DAYS = float(os.environ.get('BIBTEXER_CACHE_TTL', 30))
+except ValueError:
+    CACHE_TTL_DAYS = 30.0
 
 
 # ============== Journal Abbreviations Database ==============
 
-import os
+# Try multiple locations for the JSON file
+_JOURNAL_ABBREVIATION_PATHS = [
+    os.path.join(os.path.dirname(__file__), 'journal_abbreviations.json'),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'journal_abbreviations.json'),
+    'journal_abbreviations.json',
+    # For PyInstaller bundles
+    os.path.join(getattr(sys, '_MEIPASS', ''), 'journal_abbreviations.json'),
+]
+
+_JOURNAL_PICKLE = os.path.join(CACHE_DIR, 'journal_abbreviations.pkl')
+
 
 def _load_journal_abbreviations() -> dict:
     """
     Load journal abbreviations from external JSON file.
     Falls back to minimal embedded list if file not found.
     """
-    # Try multiple locations for the JSON file
-    possible_paths = [
-        os.path.join(os.path.dirname(__file__), 'journal_abbreviations.json'),
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'journal_abbreviations.json'),
-        'journal_abbreviations.json',
-        # For PyInstaller bundles
-        os.path.join(getattr(sys, '_MEIPASS', ''), 'journal_abbreviations.json'),
-    ]
-    
-    for path in possible_paths:
+    for path in _JOURNAL_ABBREVIATION_PATHS:
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -75,57 +241,600 @@ def _load_journal_abbreviations() -> dict:
     }
 
 
-# Load abbreviations at module import time
-JOURNAL_ABBREVIATIONS = _load_journal_abbreviations()
+def _build_journal_trie(abbreviations: dict) -> dict:
+    """
+    Build a character trie over the journal abbreviations.
+    
+    Each node maps a character to its child node; a node that completes an
+    abbreviation stores (length, -position, full name) under the '' key, so
+    that the longest (then first-listed) abbreviation compares greatest.
+    """
+    trie = {}
+    for position, (abbrev, full_name) in enumerate(abbreviations.items()):
+        if not abbrev or abbrev.startswith('_'):  # Skip comment entries
+            continue
+        node = trie
+        for char in abbrev:
+            node = node.setdefault(char, {})
+        node.setdefault('', (len(abbrev), -position, full_name))
+    return trie
+
+
+def _load_journal_tables() -> Tuple[dict, dict]:
+    """
+    Load the journal abbreviations and their trie.
+    
+    The parsed result is pickled to the cache directory, keyed by the JSON
+    file's path, size and modification time, so later starts can skip both
+    the JSON parse and the trie construction.
+    """
+    source_key = None
+    for path in _JOURNAL_ABBREVIATION_PATHS:
+        try:
+            stat = os.stat(path)
+            source_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+            break
+        except OSError:
+            continue
+    
+    if source_key and BIBTEXER_CACHE != 'ignore':
+        try:
+            with open(_JOURNAL_PICKLE, 'rb') as f:
+                key, abbrevs, trie = pickle.load(f)
+            if key == source_key:
+                return abbrevs, trie
+        except Exception:
+            pass
+    
+    abbrevs = _load_journal_abbreviations()
+    trie = _build_journal_trie(abbrevs)
+    
+    if source_key and BIBTEXER_CACHE != 'ignore':
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{_JOURNAL_PICKLE}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((source_key, abbrevs, trie), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, _JOURNAL_PICKLE)
+        except OSError:
+            pass
+    
+    return abbrevs, trie
+
+
+_journal_tables = None
+
+
+def _get_journal_tables() -> Tuple[dict, dict]:
+    """Return (abbreviations, trie), loading them on first use."""
+    global _journal_tables
+    if _journal_tables is None:
+        _journal_tables = _load_journal_tables()
+    return _journal_tables
+
+
+class _LazyAbbreviations(Mapping):
+    """
+    Read-only view of the journal abbreviations.
+    
+    The database is only loaded when it is first needed (by parse_reference),
+    so DOI lookups and conversions never pay for it.
+    """
+    
+    def __getitem__(self, key):
+        return _get_journal_tables()[0][key]
+    
+    def __iter__(self):
+        return iter(_get_journal_tables()[0])
+    
+    def __len__(self):
+        return len(_get_journal_tables()[0])
+
+
+JOURNAL_ABBREVIATIONS = _LazyAbbreviations()
 
 
 # ============== Text Processing ==============
 
+_DOI_URL_RE = re.compile(r'^https?://(dx\.)?doi\.org/')
+_DOI_PREFIX_RE = re.compile(r'^doi:', re.IGNORECASE)
+# Complete DOIs as recommended by CrossRef (covers nearly all registered ones)
+_DOI_RE = re.compile(r'^10\.\d{4,9}/[-._;()/:A-Z0-9]+$', re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Special LaTeX characters and their escaped form (applied in a single pass)
+_LATEX_TABLE = str.maketrans({
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+})
+_LATEX_SPECIAL_RE = re.compile(r'[&%$#_{}~^]')
+
+
+if hasattr(str, 'isascii'):
+    _is_ascii = str.isascii
+else:
+    def _is_ascii(text: str) -> bool:
+        """str.isascii() for Python 3.6, which does not have it."""
+        try:
+            text.encode('ascii')
+        except UnicodeEncodeError:
+            return False
+        return True
+
+
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """Normalize unicode text and escape special LaTeX characters."""
     if not text:
         return ""
-    text = unicodedata.normalize('NFC', text)
-    special_chars = {
-        '&': r'\&',
-        '%': r'\%',
-        '$': r'\$',
-        '#': r'\#',
-        '_': r'\_',
-        '{': r'\{',
-        '}': r'\}',
-        '~': r'\textasciitilde{}',
-        '^': r'\textasciicircum{}',
-    }
-    for char, replacement in special_chars.items():
-        text = text.replace(char, replacement)
-    return text
+    if _is_ascii(text):
+        # ASCII is already NFC; most names and titles need no escaping either
+        if _LATEX_SPECIAL_RE.search(text) is None:
+            return text
+        return text.translate(_LATEX_TABLE)
+    return unicodedata.normalize('NFC', text).translate(_LATEX_TABLE)
 
 
+def _strip_html(text: str) -> str:
+    """Remove HTML/JATS tags (e.g. from CrossRef abstracts)."""
+    # Most titles and many abstracts carry no markup at all
+    if '<' not in text:
+        return text
+    return _HTML_TAG_RE.sub('', text)
+
+
+@lru_cache(maxsize=4096)
 def clean_doi(doi: str) -> str:
     """Clean and normalize a DOI string."""
     doi = doi.strip()
-    doi = re.sub(r'^https?://(dx\.)?doi\.org/', '', doi)
-    doi = re.sub(r'^doi:', '', doi, flags=re.IGNORECASE)
+    doi = _DOI_URL_RE.sub('', doi)
+    doi = _DOI_PREFIX_RE.sub('', doi)
     return doi
 
 
+def is_doi(doi: str) -> bool:
+    """Whether a (cleaned) string looks like a complete DOI."""
+    return _DOI_RE.match(doi) is not None
+
+
+# ============== Response Cache ==============
+
+CACHE_DB = os.path.join(CACHE_DIR, 'crossref.db')
+
+_cache_conn = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+def _get_cache() -> Optional[sqlite3.Connection]:
+    """
+    Open the on-disk response cache on first use.
+    
+    Returns None if caching is disabled or the database cannot be opened,
+    in which case callers simply go to the network.
+    """
+    global _cache_conn, _cache_failed
+    if _cache_conn is not None or _cache_failed:
+        return _cache_conn
+    if BIBTEXER_CACHE == 'ignore':
+        _cache_failed = True
+        return None
+    
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(CACHE_DB, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS works ('
+            'doi TEXT PRIMARY KEY, etag TEXT, modified TEXT, '
+            'fetched_at INTEGER, payload BLOB)'
+        )
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS unpaywall ('
+            'doi TEXT PRIMARY KEY, etag TEXT, modified TEXT, '
+            'fetched_at INTEGER, pdf_url TEXT, found INTEGER)'
+        )
+        # Caches written before the found column existed get it added; their
+        # rows stay NULL and are left out of the per-prefix statistics
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(unpaywall)')]
+        if 'found' not in columns:
+            conn.execute('ALTER TABLE unpaywall ADD COLUMN found INTEGER')
+        if BIBTEXER_CACHE == 'clear':
+            conn.execute('DELETE FROM works')
+            conn.execute('DELETE FROM unpaywall')
+        conn.commit()
+        _cache_conn = conn
+    except (sqlite3.Error, OSError):
+        _cache_failed = True
+    return _cache_conn
+
+
+def _cache_get(doi: str) -> Optional[Tuple[Optional[str], Optional[str], int, bytes]]:
+    """Return (etag, modified, fetched_at, payload) for a cached DOI, or None."""
+    with _cache_lock:
+        conn = _get_cache()
+        if conn is None:
+            return None
+        try:
+            return conn.execute(
+                'SELECT etag, modified, fetched_at, payload FROM works WHERE doi = ?',
+                (doi.lower(),)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+
+def _cache_put(doi: str, payload: Dict, etag: Optional[str] = None,
+               modified: Optional[str] = None):
+    """Store CrossRef metadata for a DOI in the cache."""
+    with _cache_lock:
+        conn = _get_cache()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO works VALUES (?, ?, ?, ?, ?)',
+                (doi.lower(), etag, modified, int(time.time()),
+                 json.dumps(payload).encode('utf-8'))
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def _cache_touch(doi: str):
+    """Mark a cached DOI as freshly validated."""
+    with _cache_lock:
+        conn = _get_cache()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                'UPDATE works SET fetched_at = ? WHERE doi = ?',
+                (int(time.time()), doi.lower())
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def _unpaywall_cache_get(doi: str) -> Optional[Tuple[Optional[str], Optional[str], int, Optional[str]]]:
+    """Return (etag, modified, fetched_at, pdf_url) for a cached Unpaywall lookup, or None."""
+    with _cache_lock:
+        conn = _get_cache()
+        if conn is None:
+            return None
+        try:
+            return conn.execute(
+                'SELECT etag, modified, fetched_at, pdf_url FROM unpaywall WHERE doi = ?',
+                (doi.lower(),)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+
+def _unpaywall_cache_put(doi: str, pdf_url: Optional[str], etag: Optional[str] = None,
+                         modified: Optional[str] = None, found: bool = True):
+    """
+    Store the result of an Unpaywall lookup (None when there is no OA copy).
+    
+    found is False for DOIs Unpaywall does not know (404); only records it
+    actually returned count towards the per-prefix statistics.
+    """
+    with _cache_lock:
+        conn = _get_cache()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO unpaywall VALUES (?, ?, ?, ?, ?, ?)',
+                (doi.lower(), etag, modified, int(time.time()), pdf_url, int(found))
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def _unpaywall_prefix_stats(prefix: str) -> Tuple[int, int]:
+    """Return (lookups, OA hits) cached for DOIs under a registrant prefix."""
+    # '0' follows '/' in code point order, so this range is exactly the DOIs
+    # starting with "prefix/" and can be answered from the primary key index
+    prefix = prefix.lower()
+    with _cache_lock:
+        conn = _get_cache()
+        if conn is None:
+            return 0, 0
+        try:
+            return conn.execute(
+                'SELECT COUNT(*), COUNT(pdf_url) FROM unpaywall '
+                'WHERE doi >= ? AND doi < ? AND found = 1',
+                (prefix + '/', prefix + '0')
+            ).fetchone()
+        except sqlite3.Error:
+            return 0, 0
+
+
+def _cache_expire(doi: str):
+    """Mark a cached DOI as stale, so its next lookup revalidates it."""
+    with _cache_lock:
+        conn = _get_cache()
+        if conn is None:
+            return
+        try:
+            conn.execute('UPDATE works SET fetched_at = 0 WHERE doi = ?', (doi.lower(),))
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def _cache_get_fresh(doi: str) -> Optional[Dict]:
+    """Return the cached record for a DOI if it is within the TTL, else None."""
+    cached = _cache_get(doi)
+    if cached and time.time() - cached[2] < CACHE_TTL_DAYS * 86400:
+        try:
+            return _json_loads(cached[3])
+        except ValueError:
+            return None
+    return None
+
+
+# Lookups currently in progress, so concurrent requests for the same DOI
+# (e.g. a background prefetch and a button click) share one network call
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key, func, *args):
+    """Return func(*args), waiting for an identical call already in progress instead."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+    if not owner:
+        return future.result()
+    try:
+        result = func(*args)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
 # ============== CrossRef API ==============
 
+# Contact address for CrossRef's "polite pool", which gives identified clients
+# faster and more reliable service than anonymous requests
+BIBTEXER_MAILTO = os.environ.get('BIBTEXER_MAILTO')
+
+if BIBTEXER_MAILTO:
+    CROSSREF_USER_AGENT = f'BibTexer/{__version__} ({__project__}; mailto:{BIBTEXER_MAILTO})'
+else:
+    CROSSREF_USER_AGENT = f'BibTexer/{__version__} ({__project__})'
+
+# Request limit advertised by CrossRef (X-Rate-Limit-* headers), once seen
+_crossref_rate_limit = None
+
+# Statuses CrossRef answers with when clients should slow down, and how often
+# such a request is retried before giving up
+_RETRY_STATUSES = (429, 503)
+_MAX_RETRIES = 3
+
+# Longest one request may spend waiting between retries in total, so that a
+# lookup the user is waiting for fails within seconds instead of minutes
+_MAX_RETRY_WAIT = 10.0
+
+# Per-thread callback told about retries (see report_retries)
+_retry_local = threading.local()
+
+# Unpaywall lookups are made while the user waits: transient server errors are
+# retried too, starting from a shorter delay
+_UNPAYWALL_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_UNPAYWALL_RETRY_DELAY = 0.25
+
+
+def _note_rate_limit(response):
+    """Remember the per-second request limit advertised by CrossRef."""
+    global _crossref_rate_limit
+    limit = response.headers.get('X-Rate-Limit-Limit')
+    interval = response.headers.get('X-Rate-Limit-Interval', '1s')
+    try:
+        seconds = int(interval.rstrip('s')) or 1
+        _crossref_rate_limit = max(1, int(limit) // seconds)
+    except (TypeError, ValueError):
+        pass
+
+
+@contextmanager
+def report_retries(callback):
+    """
+    Call callback(retry, retries, delay) before each retry of a request made
+    on this thread within the block, e.g. to show "retrying (2/3)".
+    """
+    previous = getattr(_retry_local, 'callback', None)
+    _retry_local.callback = callback
+    try:
+        yield
+    finally:
+        _retry_local.callback = previous
+
+
+def _open_with_backoff(req: urllib.request.Request, timeout: int = 30,
+                       statuses: Tuple[int, ...] = _RETRY_STATUSES, base_delay: float = 1.0):
+    """
+    Open a request, backing off and retrying when the server asks to slow down.
+    
+    On 429/503 (or the given statuses) the request is retried after the
+    Retry-After delay, or after base_delay, then twice and four times that
+    (1, 2, 4 seconds by default) when the server does not give one. A
+    connection error or timeout is retried once, right away. No retry is
+    made once the waits would add up to more than _MAX_RETRY_WAIT seconds;
+    other errors are raised immediately.
+    """
+    waited = 0.0
+    network_retried = False
+    for attempt in range(_MAX_RETRIES + 1):
+        try:
+            return _OPENER.open(req, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if e.code not in statuses or attempt == _MAX_RETRIES:
+                raise
+            retry_after = e.headers.get('Retry-After', '') if e.headers else ''
+            delay = int(retry_after) if retry_after.isdigit() else base_delay * 2 ** attempt
+            if waited + delay > _MAX_RETRY_WAIT:
+                raise
+            if e.fp is not None:
+                e.close()  # Release the connection while waiting
+        except (urllib.error.URLError, socket.timeout):
+            if network_retried or attempt == _MAX_RETRIES:
+                raise
+            network_retried = True
+            delay = 0
+        
+        callback = getattr(_retry_local, 'callback', None)
+        if callback is not None:
+            callback(attempt + 1, _MAX_RETRIES, delay)
+        waited += delay
+        time.sleep(delay)
+
+
+def _read_json(response) -> Dict:
+    """Read and parse a JSON response body, decompressing gzip if needed."""
+    try:
+        body = response.read()
+    except (OSError, http.client.HTTPException) as e:
+        raise urllib.error.URLError(e)
+    if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+        body = gzip.decompress(body)
+    return _json_loads(body)
+
+
+# Fields CrossRef returns as lists of which only the first entry is used
+_LIST_FIELDS = ('title', 'container-title', 'ISSN', 'ISBN')
+
+
+def normalize_record(data: Dict) -> Dict:
+    """
+    Collapse CrossRef's list-valued fields to single strings, in place.
+    
+    Title, container-title, ISSN and ISBN come back as lists, of which the
+    converters and formatters only ever use the first entry. Empty lists are
+    dropped. Returns the same dict.
+    """
+    for field in _LIST_FIELDS:
+        value = data.get(field)
+        if isinstance(value, list):
+            if value:
+                data[field] = value[0]
+            else:
+                del data[field]
+    return data
+
+
+def _normalized(data: Dict) -> Dict:
+    """
+    Return data with normalize_record applied, leaving the caller's dict alone.
+    
+    Records from get_crossref_data & co. keep CrossRef's list-valued fields,
+    so they are normalized as a copy; already normalized records are
+    returned as they are.
+    """
+    if any(isinstance(data.get(field), list) for field in _LIST_FIELDS):
+        return normalize_record(dict(data))
+    return data
+
+
+def _session_cache(maxsize: int):
+    """
+    Remember a lookup's results in memory for the rest of the session.
+    
+    Like lru_cache, but results older than CACHE_TTL_DAYS are fetched again,
+    nothing is remembered with BIBTEXER_CACHE=ignore, and every caller gets
+    its own copy, so changing a returned record cannot corrupt the cache.
+    clear_lookup_caches() empties it.
+    """
+    def decorate(func):
+        @lru_cache(maxsize=maxsize)
+        def remembered(*args, **kwargs):
+            return time.time(), func(*args, **kwargs)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if BIBTEXER_CACHE == 'ignore':
+                return func(*args, **kwargs)
+            fetched_at, result = remembered(*args, **kwargs)
+            if time.time() - fetched_at >= CACHE_TTL_DAYS * 86400:
+                remembered.cache_clear()
+                fetched_at, result = remembered(*args, **kwargs)
+            return copy.deepcopy(result)
+        
+        wrapper.cache_clear = remembered.cache_clear
+        wrapper.cache_info = remembered.cache_info
+        return wrapper
+    return decorate
+
+
+@_session_cache(maxsize=512)
 def get_crossref_data(doi: str) -> Dict:
-    """Fetch metadata from CrossRef API for a given DOI."""
+    """
+    Fetch metadata from CrossRef API for a given DOI.
+    
+    Responses are kept in a local cache. Entries younger than CACHE_TTL_DAYS
+    are returned directly; older ones are revalidated with a conditional
+    request (ETag / Last-Modified) instead of re-downloaded. Within a session,
+    repeated lookups of the same DOI are answered from memory (until
+    clear_lookup_caches), and concurrent ones share a single request.
+    """
+    return _single_flight(('works', doi.lower()), _fetch_crossref_data, doi)
+
+
+def _fetch_crossref_data(doi: str) -> Dict:
+    """Look up a DOI in the local cache or on CrossRef (see get_crossref_data)."""
     url = f"https://api.crossref.org/works/{urllib.parse.quote(doi, safe='')}"
     
     req = urllib.request.Request(url)
-    req.add_header('User-Agent', f'BibTexer/{__version__} (mailto:user@example.com)')
+    req.add_header('User-Agent', CROSSREF_USER_AGENT)
     req.add_header('Accept', 'application/json')
+    req.add_header('Accept-Encoding', 'gzip')
+    
+    cached = _cache_get(doi)
+    if cached:
+        etag, modified, fetched_at, payload = cached
+        if time.time() - fetched_at < CACHE_TTL_DAYS * 86400:
+            return _json_loads(payload)
+        if etag:
+            req.add_header('If-None-Match', etag)
+        if modified:
+            req.add_header('If-Modified-Since', modified)
     
     try:
-        with urllib.request.urlopen(req, timeout=30, context=ssl_context) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return data['message']
+        with _open_with_backoff(req) as response:
+            _note_rate_limit(response)
+            data = _read_json(response)['message']
+            _cache_put(
+                doi, data,
+                etag=response.headers.get('ETag'),
+                modified=response.headers.get('Last-Modified')
+            )
+            return data
     except urllib.error.HTTPError as e:
-        if e.code == 404:
+        if e.code == 304 and cached:
+            _cache_touch(doi)
+            return _json_loads(payload)
+        elif e.code == 404:
             raise ValueError(f"DOI not found: {doi}")
         else:
             raise ValueError(f"HTTP error {e.code}: {e.reason}")
@@ -135,6 +844,105 @@ def get_crossref_data(doi: str) -> Dict:
         raise ValueError("Invalid response from CrossRef API")
 
 
+def get_crossref_data_batch(dois: List[str], chunk: int = 20) -> Dict[str, Dict]:
+    """
+    Fetch metadata for several DOIs with as few CrossRef requests as possible.
+    
+    Uses the works endpoint with a ``doi:`` filter so that up to ``chunk`` DOIs
+    are resolved by a single request. Returns a dict mapping each requested
+    (cleaned) DOI to its metadata; DOIs unknown to CrossRef are left out.
+    Records still fresh in the local cache are not requested again. DOIs the
+    filter cannot express, and chunks whose request fails, are looked up one
+    by one instead.
+    """
+    dois = [clean_doi(d) for d in dois if d and d.strip()]
+    results = {}
+    
+    # Serve whatever the local cache still considers fresh
+    for doi in dois:
+        cached = _cache_get_fresh(doi)
+        if cached is not None:
+            results[doi] = cached
+    dois = [doi for doi in dois if doi not in results]
+    
+    # Commas separate filter clauses, so such DOIs cannot go into the filter
+    unfilterable = [doi for doi in dois if ',' in doi]
+    if unfilterable:
+        results.update(get_crossref_data_many(unfilterable))
+        dois = [doi for doi in dois if ',' not in doi]
+    
+    start = 0
+    while start < len(dois):
+        batch = dois[start:start + chunk]
+        params = {
+            'filter': ','.join(f'doi:{d}' for d in batch),
+            'rows': str(len(batch)),
+        }
+        url = f"https://api.crossref.org/works?{urllib.parse.urlencode(params)}"
+        
+        req = urllib.request.Request(url)
+        req.add_header('User-Agent', CROSSREF_USER_AGENT)
+        req.add_header('Accept', 'application/json')
+        req.add_header('Accept-Encoding', 'gzip')
+        
+        try:
+            with _open_with_backoff(req) as response:
+                _note_rate_limit(response)
+                data = _read_json(response)
+                items = data['message'].get('items', [])
+        except urllib.error.HTTPError as e:
+            if e.code == 414 and chunk > 1:
+                # URL too long - retry with smaller batches, for the rest too
+                chunk = max(1, chunk // 2)
+                continue
+            # Any other failure - fall back to one request per DOI for this batch
+            results.update(get_crossref_data_many(batch))
+            start += len(batch)
+            continue
+        except (urllib.error.URLError, json.JSONDecodeError, KeyError):
+            results.update(get_crossref_data_many(batch))
+            start += len(batch)
+            continue
+        start += len(batch)
+        
+        found = {item['DOI'].lower(): item for item in items if 'DOI' in item}
+        for doi in batch:
+            if doi.lower() in found:
+                results[doi] = found[doi.lower()]
+                _cache_put(doi, results[doi])
+    
+    return results
+
+
+def get_crossref_data_many(dois: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+    """
+    Fetch metadata for several DOIs concurrently, one request per DOI.
+    
+    Requests run in a small thread pool so network round-trips overlap,
+    never more at once than CrossRef's advertised rate limit allows.
+    Returns a dict mapping each (cleaned) DOI to its metadata; DOIs that
+    could not be fetched are left out.
+    """
+    dois = list(dict.fromkeys(clean_doi(d) for d in dois if d and d.strip()))
+    results = {}
+    if not dois:
+        return results
+    
+    if _crossref_rate_limit:
+        max_workers = min(max_workers, _crossref_rate_limit)
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(dois))) as executor:
+        futures = [(doi, executor.submit(get_crossref_data, doi)) for doi in dois]
+        for doi, future in futures:
+            try:
+                results[doi] = future.result()
+            except ValueError:
+                continue
+    
+    return results
+
+
+@_session_cache(maxsize=128)
 def search_crossref(
     query: Optional[str] = None,
     author: Optional[str] = None,
@@ -146,7 +954,9 @@ def search_crossref(
     """
     Search CrossRef API for references matching the given criteria.
     
-    Returns a list of matching items with their metadata.
+    Returns a list of matching items with their metadata. Repeating a search
+    within a session returns the earlier result without a new request (until
+    clear_lookup_caches).
     """
     base_url = "https://api.crossref.org/works"
     params = {'rows': str(rows)}
@@ -174,231 +984,323 @@ def search_crossref(
     url = f"{base_url}?{urllib.parse.urlencode(params)}"
     
     req = urllib.request.Request(url)
-    req.add_header('User-Agent', f'BibTexer/{__version__} (mailto:user@example.com)')
+    req.add_header('User-Agent', CROSSREF_USER_AGENT)
     req.add_header('Accept', 'application/json')
+    req.add_header('Accept-Encoding', 'gzip')
     
     try:
-        with urllib.request.urlopen(req, timeout=30, context=ssl_context) as response:
-            data = json.loads(response.read().decode('utf-8'))
+        with _open_with_backoff(req) as response:
+            _note_rate_limit(response)
+            data = _read_json(response)
             return data['message'].get('items', [])
     except Exception as e:
         raise ValueError(f"Search failed: {e}")
 
 
+def clear_lookup_caches(doi: Optional[str] = None):
+    """
+    Forget the CrossRef lookups and searches remembered in this session.
+    
+    If a DOI is given, its record in the local cache is marked stale as well,
+    so the next lookup asks CrossRef whether it has changed.
+    """
+    get_crossref_data.cache_clear()
+    search_crossref.cache_clear()
+    if doi:
+        _cache_expire(doi)
+
+
 # ============== BibTeX Conversion ==============
 
-def format_authors(authors: List[Dict]) -> Optional[str]:
-    """Format author list for BibTeX."""
-    if not authors:
-        return None
+class _CiteKeyTable(dict):
+    """
+    str.translate() table that keeps a-z and deletes everything else.
     
-    formatted = []
-    for author in authors:
-        family = author.get('family', '')
-        given = author.get('given', '')
-        if family and given:
-            formatted.append(f"{family}, {given}")
-        elif family:
-            formatted.append(family)
-        elif given:
-            formatted.append(given)
+    Entries are filled in on first sight of each code point, so later
+    lookups stay in C instead of going through the regex engine.
+    """
     
+    def __missing__(self, codepoint):
+        value = codepoint if 97 <= codepoint <= 122 else None
+        self[codepoint] = value
+        return value
+
+
+_CITE_KEY_TABLE = _CiteKeyTable()
+
+_BIBTEX_FIELD_ORDER = (
+    'author', 'title', 'journal', 'booktitle', 'year', 'month',
+    'volume', 'number', 'pages', 'publisher', 'editor',
+    'doi', 'url', 'issn', 'isbn', 'abstract',
+)
+
+# CrossRef type -> BibTeX entry type
+_BIBTEX_TYPES = {
+    'journal-article': 'article',
+    'proceedings-article': 'inproceedings',
+    'book-chapter': 'incollection',
+    'book': 'book',
+    'edited-book': 'book',
+    'monograph': 'book',
+    'report': 'techreport',
+    'dissertation': 'phdthesis',
+    'dataset': 'misc',
+    'posted-content': 'misc',
+    'reference-entry': 'misc',
+}
+
+# CrossRef date fields, in order of preference
+_DATE_FIELDS = ('published-print', 'published-online', 'issued', 'created')
+
+_MONTHS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun',
+           'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+
+
+def _people(entries: Optional[List[Dict]]) -> List[Tuple[str, str]]:
+    """Return (family, given) for each author/editor entry that has a name."""
+    return [
+        (person.get('family', ''), person.get('given', ''))
+        for person in entries or ()
+        if person.get('family') or person.get('given')
+    ]
+
+
+def format_authors(authors: List[Dict]) -> Optional[str]:
+    """Format author list for BibTeX."""
+    formatted = [
+        f"{family}, {given}" if family and given else family or given
+        for family, given in _people(authors)
+    ]
     return " and ".join(formatted) if formatted else None
 
 
-def generate_cite_key(data: Dict) -> str:
+def _extract_date(data: Dict) -> Tuple[Optional[str], Optional[str], Optional[List]]:
+    """
+    Extract (year, month, date parts) from the CrossRef date fields in a single walk.
+    
+    The year comes from the first date field that has one; the month from the
+    first field (other than 'created') with a valid month number. The date
+    parts ([year, month, day], possibly shorter) are those of the first field
+    other than 'created' that has any.
+    """
+    year = None
+    month = None
+    date = None
+    for date_field in _DATE_FIELDS:
+        value = data.get(date_field)
+        date_parts = value.get('date-parts') if value else None
+        if not (date_parts and date_parts[0]):
+            continue
+        parts = date_parts[0]
+        if year is None and parts[0]:
+            year = str(parts[0])
+        if date_field != 'created':
+            if date is None:
+                date = parts
+            if month is None and len(parts) > 1:
+                month_num = parts[1]
+                if isinstance(month_num, int) and 1 <= month_num <= 12:
+                    month = _MONTHS[month_num - 1]
+        if year and month:
+            break
+    return year, month, date
+
+
+@lru_cache(maxsize=4096)
+def _cite_key_author(family: str) -> str:
+    """Reduce a family name to the lowercase a-z letters used in cite keys."""
+    return family.lower().translate(_CITE_KEY_TABLE)
+
+
+def generate_cite_key(data: Dict, year: Optional[str] = None) -> str:
     """Generate a citation key from author and year."""
     authors = data.get('author', [])
     if authors and 'family' in authors[0]:
-        author_part = authors[0]['family'].lower()
-        author_part = re.sub(r'[^a-z]', '', author_part)
+        author_part = _cite_key_author(authors[0]['family'])
     else:
         author_part = 'unknown'
     
-    date_parts = None
-    for date_field in ['published-print', 'published-online', 'issued', 'created']:
-        if date_field in data and 'date-parts' in data[date_field]:
-            date_parts = data[date_field]['date-parts']
-            break
-    
-    if date_parts and date_parts[0] and date_parts[0][0]:
-        year_part = str(date_parts[0][0])
-    else:
-        year_part = 'nd'
+    if year is None:
+        year = _extract_date(data)[0]
     
-    return f"{author_part}{year_part}"
+    return f"{author_part}{year or 'nd'}"
 
 
 def get_year(data: Dict) -> Optional[str]:
     """Extract publication year from data."""
-    for date_field in ['published-print', 'published-online', 'issued', 'created']:
-        if date_field in data and 'date-parts' in data[date_field]:
-            date_parts = data[date_field]['date-parts']
-            if date_parts and date_parts[0] and date_parts[0][0]:
-                return str(date_parts[0][0])
-    return None
+    return _extract_date(data)[0]
 
 
 def get_month(data: Dict) -> Optional[str]:
     """Extract publication month from data."""
-    for date_field in ['published-print', 'published-online', 'issued']:
-        if date_field in data and 'date-parts' in data[date_field]:
-            date_parts = data[date_field]['date-parts']
-            if date_parts and date_parts[0] and len(date_parts[0]) > 1:
-                month_num = date_parts[0][1]
-                months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
-                         'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-                if 1 <= month_num <= 12:
-                    return months[month_num - 1]
-    return None
+    return _extract_date(data)[1]
 
 
 def get_entry_type(data: Dict) -> str:
     """Determine BibTeX entry type from CrossRef type."""
-    crossref_type = data.get('type', 'journal-article')
-    
-    type_mapping = {
-        'journal-article': 'article',
-        'proceedings-article': 'inproceedings',
-        'book-chapter': 'incollection',
-        'book': 'book',
-        'edited-book': 'book',
-        'monograph': 'book',
-        'report': 'techreport',
-        'dissertation': 'phdthesis',
-        'dataset': 'misc',
-        'posted-content': 'misc',
-        'reference-entry': 'misc',
-    }
+    return _BIBTEX_TYPES.get(data.get('type', 'journal-article'), 'article')
+
+
+# Default for fields that are emitted whenever present, whatever their value
+_MISSING = object()
+
+# Generated source for each BibTeX field, in terms of the CrossRef record
+# `d`, the extracted `year`/`month` and the line collector `add`.
+_BIBTEX_FIELD_SOURCE = {
+    'author': """
+    value = format_authors(d.get('author', []))
+    if value:
+        add(f'  author = {{{normalize_text(value)}}},')
+""",
+    'title': """
+    value = d.get('title')
+    if value:
+        add(f'  title = {{{normalize_text(value)}}},')
+""",
+    'journal': """
+    value = d.get('container-title')
+    if value:
+        add(f'  journal = {{{normalize_text(value)}}},')
+""",
+    'booktitle': """
+    value = d.get('container-title')
+    if value:
+        add(f'  booktitle = {{{normalize_text(value)}}},')
+""",
+    'year': """
+    if year:
+        add(f'  year = {{{year}}},')
+""",
+    'month': """
+    if month:
+        add(f'  month = {month},')
+""",
+    'volume': """
+    value = d.get('volume')
+    if value:
+        add(f'  volume = {{{value}}},')
+""",
+    'number': """
+    value = d.get('issue')
+    if value:
+        add(f'  number = {{{value}}},')
+""",
+    'pages': """
+    value = d.get('page')
+    if value:
+        add(f"  pages = {{{value.replace('-', '--')}}},")
+""",
+    'publisher': """
+    value = d.get('publisher')
+    if value:
+        add(f'  publisher = {{{normalize_text(value)}}},')
+""",
+    'editor': """
+    value = format_authors(d.get('editor', []))
+    if value:
+        add(f'  editor = {{{normalize_text(value)}}},')
+""",
+    'doi': """
+    value = d.get('DOI', _MISSING)
+    if value is not _MISSING:
+        add(f'  doi = {{{value}}},')
+""",
+    'url': """
+    value = d.get('URL', _MISSING)
+    if value is not _MISSING:
+        add(f'  url = {{{value}}},')
+""",
+    'issn': """
+    value = d.get('ISSN')
+    if value:
+        add(f'  issn = {{{value}}},')
+""",
+    'isbn': """
+    value = d.get('ISBN')
+    if value:
+        add(f'  isbn = {{{value}}},')
+""",
+    'abstract': """
+    value = d.get('abstract')
+    if value:
+        add(f'  abstract = {{{normalize_text(_strip_html(value))}}},')
+""",
+}
+
+# Entry types that carry the container title, and under which field
+_BIBTEX_CONTAINER_FIELDS = {
+    'article': 'journal',
+    'incollection': 'booktitle',
+    'inproceedings': 'booktitle',
+}
+
+
+def _compile_bibtex_formatter(entry_type: str):
+    """
+    Generate the BibTeX formatter for one entry type.
     
-    return type_mapping.get(crossref_type, 'article')
+    Only the fields the type can carry are inlined, in canonical order, so
+    converting a record is a straight run of field checks with no per-entry
+    field dict or ordering pass.
+    """
+    container = _BIBTEX_CONTAINER_FIELDS.get(entry_type)
+    body = ''.join(
+        _BIBTEX_FIELD_SOURCE[field] for field in _BIBTEX_FIELD_ORDER
+        if field not in ('journal', 'booktitle') or field == container
+    )
+    source = (
+        "def _format(d, cite_key, year, month):\n"
+        f"    lines = ['@{entry_type}{{' + cite_key + ',']\n"
+        "    add = lines.append\n"
+        f"{body}"
+        "    if len(lines) > 1:\n"
+        "        lines[-1] = lines[-1][:-1]  # No comma after the last field\n"
+        "    add('}')\n"
+        "    return '\\n'.join(lines)\n"
+    )
+    namespace = {}
+    exec(compile(source, f'<bibtex:{entry_type}>', 'exec'), globals(), namespace)
+    return namespace['_format']
+
+
+# BibTeX entry type -> generated formatter
+_BIBTEX_FORMATTERS = {
+    entry_type: _compile_bibtex_formatter(entry_type)
+    for entry_type in sorted(set(_BIBTEX_TYPES.values()) | {'article'})
+}
 
 
 def convert_to_bibtex(data: Dict) -> str:
     """Convert CrossRef metadata to BibTeX entry."""
-    entry_type = get_entry_type(data)
-    cite_key = generate_cite_key(data)
-    
-    fields = {}
-    
-    # Title
-    if 'title' in data and data['title']:
-        title = data['title'][0] if isinstance(data['title'], list) else data['title']
-        fields['title'] = f"{{{normalize_text(title)}}}"
-    
-    # Authors
-    authors = format_authors(data.get('author', []))
-    if authors:
-        fields['author'] = f"{{{normalize_text(authors)}}}"
-    
-    # Editors
-    editors = format_authors(data.get('editor', []))
-    if editors:
-        fields['editor'] = f"{{{normalize_text(editors)}}}"
-    
-    # Year and Month
-    year = get_year(data)
-    if year:
-        fields['year'] = f"{{{year}}}"
-    
-    month = get_month(data)
-    if month:
-        fields['month'] = month
-    
-    # Journal/Container
-    if 'container-title' in data and data['container-title']:
-        container = data['container-title'][0] if isinstance(data['container-title'], list) else data['container-title']
-        if entry_type == 'article':
-            fields['journal'] = f"{{{normalize_text(container)}}}"
-        elif entry_type in ['incollection', 'inproceedings']:
-            fields['booktitle'] = f"{{{normalize_text(container)}}}"
-    
-    # Volume
-    if 'volume' in data and data['volume']:
-        fields['volume'] = f"{{{data['volume']}}}"
-    
-    # Number/Issue
-    if 'issue' in data and data['issue']:
-        fields['number'] = f"{{{data['issue']}}}"
-    
-    # Pages
-    if 'page' in data and data['page']:
-        pages = data['page'].replace('-', '--')
-        fields['pages'] = f"{{{pages}}}"
-    
-    # DOI
-    if 'DOI' in data:
-        fields['doi'] = f"{{{data['DOI']}}}"
-    
-    # URL
-    if 'URL' in data:
-        fields['url'] = f"{{{data['URL']}}}"
-    
-    # Publisher
-    if 'publisher' in data and data['publisher']:
-        fields['publisher'] = f"{{{normalize_text(data['publisher'])}}}"
-    
-    # ISSN
-    if 'ISSN' in data and data['ISSN']:
-        issn = data['ISSN'][0] if isinstance(data['ISSN'], list) else data['ISSN']
-        fields['issn'] = f"{{{issn}}}"
-    
-    # ISBN
-    if 'ISBN' in data and data['ISBN']:
-        isbn = data['ISBN'][0] if isinstance(data['ISBN'], list) else data['ISBN']
-        fields['isbn'] = f"{{{isbn}}}"
-    
-    # Abstract
-    if 'abstract' in data and data['abstract']:
-        abstract = re.sub(r'<[^>]+>', '', data['abstract'])
-        fields['abstract'] = f"{{{normalize_text(abstract)}}}"
-    
-    # Build BibTeX string
-    bibtex = f"@{entry_type}{{{cite_key},\n"
-    
-    field_order = ['author', 'title', 'journal', 'booktitle', 'year', 'month',
-                   'volume', 'number', 'pages', 'publisher', 'editor',
-                   'doi', 'url', 'issn', 'isbn', 'abstract']
-    
-    ordered_fields = []
-    for field in field_order:
-        if field in fields:
-            ordered_fields.append((field, fields[field]))
-    
-    for field, value in fields.items():
-        if field not in field_order:
-            ordered_fields.append((field, value))
-    
-    for i, (field, value) in enumerate(ordered_fields):
-        comma = "," if i < len(ordered_fields) - 1 else ""
-        bibtex += f"  {field} = {value}{comma}\n"
-    
-    bibtex += "}"
-    
-    return bibtex
+    data = _normalized(data)
+    year, month, _ = _extract_date(data)
+    cite_key = generate_cite_key(data, year)
+    return _BIBTEX_FORMATTERS[get_entry_type(data)](data, cite_key, year, month)
 
 
 # ============== RIS Conversion (NEW in v4.0) ==============
 
+_PAGE_DASH_RE = re.compile(r'[-–—]')
+
+# CrossRef type -> RIS reference type
+_RIS_TYPES = {
+    'journal-article': 'JOUR',
+    'proceedings-article': 'CONF',
+    'book-chapter': 'CHAP',
+    'book': 'BOOK',
+    'edited-book': 'EDBOOK',
+    'monograph': 'BOOK',
+    'report': 'RPRT',
+    'dissertation': 'THES',
+    'dataset': 'DATA',
+    'posted-content': 'GEN',
+    'reference-entry': 'GEN',
+}
+
+
 def get_ris_type(data: Dict) -> str:
     """Determine RIS type from CrossRef type."""
-    crossref_type = data.get('type', 'journal-article')
-    
-    type_mapping = {
-        'journal-article': 'JOUR',
-        'proceedings-article': 'CONF',
-        'book-chapter': 'CHAP',
-        'book': 'BOOK',
-        'edited-book': 'EDBOOK',
-        'monograph': 'BOOK',
-        'report': 'RPRT',
-        'dissertation': 'THES',
-        'dataset': 'DATA',
-        'posted-content': 'GEN',
-        'reference-entry': 'GEN',
-    }
-    
-    return type_mapping.get(crossref_type, 'JOUR')
+    return _RIS_TYPES.get(data.get('type', 'journal-article'), 'JOUR')
 
 
 def convert_to_ris(data: Dict) -> str:
@@ -408,6 +1310,7 @@ def convert_to_ris(data: Dict) -> str:
     RIS is a standardized tag format for bibliographic data.
     Widely supported by Zotero, EndNote, Mendeley, Papers, etc.
     """
+    data = _normalized(data)
     lines = []
     
     # Type of reference
@@ -415,53 +1318,40 @@ def convert_to_ris(data: Dict) -> str:
     
     # Title
     if 'title' in data and data['title']:
-        title = data['title'][0] if isinstance(data['title'], list) else data['title']
+        title = data['title']
         # Remove any HTML tags
-        title = re.sub(r'<[^>]+>', '', title)
+        title = _strip_html(title)
         lines.append(f"TI  - {title}")
     
     # Authors (each author on separate AU line)
-    if 'author' in data:
-        for author in data['author']:
-            family = author.get('family', '')
-            given = author.get('given', '')
-            if family and given:
-                lines.append(f"AU  - {family}, {given}")
-            elif family:
-                lines.append(f"AU  - {family}")
-            elif given:
-                lines.append(f"AU  - {given}")
+    for family, given in _people(data.get('author')):
+        if family and given:
+            lines.append(f"AU  - {family}, {given}")
+        else:
+            lines.append(f"AU  - {family or given}")
     
     # Editors
-    if 'editor' in data:
-        for editor in data['editor']:
-            family = editor.get('family', '')
-            given = editor.get('given', '')
-            if family and given:
-                lines.append(f"ED  - {family}, {given}")
-            elif family:
-                lines.append(f"ED  - {family}")
+    for family, given in _people(data.get('editor')):
+        if family and given:
+            lines.append(f"ED  - {family}, {given}")
+        elif family:
+            lines.append(f"ED  - {family}")
     
     # Publication year
-    year = get_year(data)
+    year, _, date = _extract_date(data)
     if year:
         lines.append(f"PY  - {year}")
     
     # Full date if available
-    for date_field in ['published-print', 'published-online', 'issued']:
-        if date_field in data and 'date-parts' in data[date_field]:
-            date_parts = data[date_field]['date-parts']
-            if date_parts and date_parts[0]:
-                parts = date_parts[0]
-                if len(parts) >= 3:
-                    lines.append(f"DA  - {parts[0]}/{parts[1]:02d}/{parts[2]:02d}")
-                elif len(parts) >= 2:
-                    lines.append(f"DA  - {parts[0]}/{parts[1]:02d}")
-                break
+    if date:
+        if len(date) >= 3:
+            lines.append(f"DA  - {date[0]}/{date[1]:02d}/{date[2]:02d}")
+        elif len(date) >= 2:
+            lines.append(f"DA  - {date[0]}/{date[1]:02d}")
     
     # Journal/Container title
     if 'container-title' in data and data['container-title']:
-        container = data['container-title'][0] if isinstance(data['container-title'], list) else data['container-title']
+        container = data['container-title']
         if get_ris_type(data) == 'JOUR':
             lines.append(f"JO  - {container}")
             # Also add abbreviated journal title if different
@@ -480,11 +1370,10 @@ def convert_to_ris(data: Dict) -> str:
     # Pages
     if 'page' in data and data['page']:
         pages = data['page']
-        if '-' in pages:
-            parts = re.split(r'[-–—]', pages)
-            if len(parts) >= 2:
-                lines.append(f"SP  - {parts[0].strip()}")
-                lines.append(f"EP  - {parts[1].strip()}")
+        parts = _PAGE_DASH_RE.split(pages)
+        if len(parts) >= 2:
+            lines.append(f"SP  - {parts[0].strip()}")
+            lines.append(f"EP  - {parts[1].strip()}")
         else:
             lines.append(f"SP  - {pages}")
     
@@ -502,17 +1391,17 @@ def convert_to_ris(data: Dict) -> str:
     
     # ISSN
     if 'ISSN' in data and data['ISSN']:
-        issn = data['ISSN'][0] if isinstance(data['ISSN'], list) else data['ISSN']
+        issn = data['ISSN']
         lines.append(f"SN  - {issn}")
     
     # ISBN
     if 'ISBN' in data and data['ISBN']:
-        isbn = data['ISBN'][0] if isinstance(data['ISBN'], list) else data['ISBN']
+        isbn = data['ISBN']
         lines.append(f"SN  - {isbn}")
     
     # Abstract
     if 'abstract' in data and data['abstract']:
-        abstract = re.sub(r'<[^>]+>', '', data['abstract'])
+        abstract = _strip_html(data['abstract'])
         lines.append(f"AB  - {abstract}")
     
     # Language
@@ -535,21 +1424,50 @@ def convert_to_ris(data: Dict) -> str:
 ZOTERO_CONNECTOR_PORT = 23119
 ZOTERO_CONNECTOR_URL = f"http://127.0.0.1:{ZOTERO_CONNECTOR_PORT}"
 
-
-def is_zotero_running() -> bool:
+# CrossRef type -> CSL-JSON item type
+_CSL_TYPES = {
+    'journal-article': 'article-journal',
+    'proceedings-article': 'paper-conference',
+    'book-chapter': 'chapter',
+    'book': 'book',
+    'edited-book': 'book',
+    'monograph': 'book',
+    'report': 'report',
+    'dissertation': 'thesis',
+    'dataset': 'dataset',
+    'posted-content': 'article',
+    'reference-entry': 'entry',
+}
+
+
+# Seconds a probe of the connector port is trusted, and the last result
+# as (time.monotonic() of the probe, running)
+ZOTERO_CHECK_TTL = 5.0
+_zotero_check = None
+
+
+def is_zotero_running(max_age: float = ZOTERO_CHECK_TTL) -> bool:
     """
     Check if Zotero is running by testing the local connector port.
     
     Zotero runs a local web server on port 23119 for browser connector integration.
+    The result is reused for ``max_age`` seconds, so sending several references
+    in a row probes the port only once; pass 0 to force a fresh check.
     """
+    global _zotero_check
+    now = time.monotonic()
+    if _zotero_check is not None and now - _zotero_check[0] < max_age:
+        return _zotero_check[1]
+    
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex(('127.0.0.1', ZOTERO_CONNECTOR_PORT))
-        sock.close()
-        return result == 0
-    except Exception:
-        return False
+        # Loopback connects succeed or are refused immediately
+        with socket.create_connection(('127.0.0.1', ZOTERO_CONNECTOR_PORT), timeout=0.25):
+            running = True
+    except OSError:
+        running = False
+    
+    _zotero_check = (now, running)
+    return running
 
 
 def convert_to_csl_json(data: Dict) -> Dict:
@@ -559,65 +1477,37 @@ def convert_to_csl_json(data: Dict) -> Dict:
     CSL-JSON is the format used by Zotero and other citation managers.
     CrossRef data is already close to CSL-JSON, but needs some adjustments.
     """
+    data = _normalized(data)
     csl = {}
     
     # Type mapping
-    crossref_type = data.get('type', 'journal-article')
-    type_mapping = {
-        'journal-article': 'article-journal',
-        'proceedings-article': 'paper-conference',
-        'book-chapter': 'chapter',
-        'book': 'book',
-        'edited-book': 'book',
-        'monograph': 'book',
-        'report': 'report',
-        'dissertation': 'thesis',
-        'dataset': 'dataset',
-        'posted-content': 'article',
-        'reference-entry': 'entry',
-    }
-    csl['type'] = type_mapping.get(crossref_type, 'article-journal')
+    csl['type'] = _CSL_TYPES.get(data.get('type', 'journal-article'), 'article-journal')
     
     # Title
     if 'title' in data and data['title']:
-        title = data['title'][0] if isinstance(data['title'], list) else data['title']
-        csl['title'] = re.sub(r'<[^>]+>', '', title)
-    
-    # Authors
-    if 'author' in data:
-        csl['author'] = []
-        for author in data['author']:
-            author_obj = {}
-            if 'family' in author:
-                author_obj['family'] = author['family']
-            if 'given' in author:
-                author_obj['given'] = author['given']
-            if author_obj:
-                csl['author'].append(author_obj)
-    
-    # Editors
-    if 'editor' in data:
-        csl['editor'] = []
-        for editor in data['editor']:
-            editor_obj = {}
-            if 'family' in editor:
-                editor_obj['family'] = editor['family']
-            if 'given' in editor:
-                editor_obj['given'] = editor['given']
-            if editor_obj:
-                csl['editor'].append(editor_obj)
+        title = data['title']
+        csl['title'] = _strip_html(title)
+    
+    # Authors and editors
+    for role in ('author', 'editor'):
+        if role in data:
+            csl[role] = [
+                {'family': family, 'given': given} if family and given
+                else {'family': family} if family else {'given': given}
+                for family, given in _people(data[role])
+            ]
     
     # Date
-    for date_field in ['published-print', 'published-online', 'issued', 'created']:
-        if date_field in data and 'date-parts' in data[date_field]:
-            date_parts = data[date_field]['date-parts']
-            if date_parts and date_parts[0]:
-                csl['issued'] = {'date-parts': date_parts}
-                break
+    for date_field in _DATE_FIELDS:
+        value = data.get(date_field)
+        date_parts = value.get('date-parts') if value else None
+        if date_parts and date_parts[0]:
+            csl['issued'] = {'date-parts': date_parts}
+            break
     
     # Container/Journal title
     if 'container-title' in data and data['container-title']:
-        container = data['container-title'][0] if isinstance(data['container-title'], list) else data['container-title']
+        container = data['container-title']
         csl['container-title'] = container
     
     # Volume, issue, page
@@ -640,17 +1530,17 @@ def convert_to_csl_json(data: Dict) -> Dict:
     
     # ISSN
     if 'ISSN' in data and data['ISSN']:
-        issn = data['ISSN'][0] if isinstance(data['ISSN'], list) else data['ISSN']
+        issn = data['ISSN']
         csl['ISSN'] = issn
     
     # ISBN
     if 'ISBN' in data and data['ISBN']:
-        isbn = data['ISBN'][0] if isinstance(data['ISBN'], list) else data['ISBN']
+        isbn = data['ISBN']
         csl['ISBN'] = isbn
     
     # Abstract
     if 'abstract' in data and data['abstract']:
-        csl['abstract'] = re.sub(r'<[^>]+>', '', data['abstract'])
+        csl['abstract'] = _strip_html(data['abstract'])
     
     # Language
     if 'language' in data:
@@ -672,7 +1562,7 @@ def send_to_zotero_local(data: Dict) -> Tuple[bool, str]:
     Returns:
         Tuple of (success: bool, message: str)
     """
-    import time
+    global _zotero_check
     
     if not is_zotero_running():
         return False, "Zotero is not running. Please open Zotero and try again."
@@ -696,7 +1586,7 @@ def send_to_zotero_local(data: Dict) -> Tuple[bool, str]:
                 method='POST'
             )
             
-            with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response:
+            with _OPENER.open(req, timeout=10) as response:
                 if response.status in [200, 201]:
                     return True, "Reference added to Zotero!"
                 else:
@@ -712,6 +1602,7 @@ def send_to_zotero_local(data: Dict) -> Tuple[bool, str]:
             else:
                 return False, f"Zotero error: {e.code} - {e.reason}"
         except urllib.error.URLError as e:
+            _zotero_check = None  # Zotero may have quit - probe again next time
             return False, f"Connection error: {e.reason}"
         except Exception as e:
             return False, f"Import error: {str(e)}"
@@ -721,6 +1612,77 @@ def send_to_zotero_local(data: Dict) -> Tuple[bool, str]:
 
 # ============== Reference Parser ==============
 
+_YEAR_PATTERNS = [
+    re.compile(r'\((\d{4})\)'),  # (2021)
+    re.compile(r'\b(19\d{2}|20\d{2})\b'),  # standalone year
+]
+
+_VOL_PAGE_PATTERNS = [
+    re.compile(r'\b(\d+)\s*,\s*(\d+(?:[-–]\d+)?)\b', re.IGNORECASE),
+    re.compile(r'\b(\d+)\s*:\s*(\d+(?:[-–]\d+)?)\b', re.IGNORECASE),
+    re.compile(r'vol\.?\s*(\d+)\s*,?\s*(?:p\.?|pp\.?)?\s*(\d+(?:[-–]\d+)?)', re.IGNORECASE),
+    re.compile(r'\b(\d+)\s*\([\d]+\)\s*[:,]?\s*(\d+(?:[-–]\d+)?)', re.IGNORECASE),
+]
+
+_AUTHOR_PATTERNS = [
+    # "G. Thomas and M. J. Whelan" - initials before surname
+    re.compile(r'^([A-Z]\.\s*(?:[A-Z]\.\s*)?[A-Za-z]+(?:\s+(?:and|&)\s+[A-Z]\.\s*(?:[A-Z]\.\s*)?[A-Za-z]+)*)'),
+    # "Thomas, G." or "Thomas, G. and Whelan, M. J."
+    re.compile(r'^([A-Za-z]+,?\s*[A-Z]\.(?:\s*[A-Z]\.)?(?:\s*(?:,|and|&)\s*[A-Za-z]+,?\s*[A-Z]\.(?:\s*[A-Z]\.)?)*)'),
+    # "Ji B, Gao H" - surname + initial without period
+    re.compile(r'^([A-Z][a-z]+\s+[A-Z](?:,\s*[A-Z][a-z]+\s+[A-Z])*)'),
+    # "Smith AB, Jones CD" - surname + initials without periods
+    re.compile(r'^([A-Z][a-z]+\s+[A-Z]{1,2}(?:,\s*[A-Z][a-z]+\s+[A-Z]{1,2})*)'),
+    # "et al."
+    re.compile(r'^([A-Za-z]+\s+et\s+al\.?)'),
+]
+
+_CAPS_JOURNAL_RE = re.compile(r'^([A-Z][A-Z\s]+[A-Z])\b')
+
+_TITLE_PATTERNS = [
+    re.compile(r'"([^"]+)"', re.DOTALL),
+    re.compile(r"'([^']+)'", re.DOTALL),
+    # Title after year in parentheses: "(2023) Title here. Journal"
+    re.compile(r'\(\d{4}\)\s+([A-Z][^.]+(?:\.[^.]+)*?)(?:\.\s+[A-Z][a-z]+\s|\.\s*$)', re.DOTALL),
+    # Title after year without parens: "2023. Title here. Journal"  
+    re.compile(r'\d{4}[\.\)]\s*([A-Z][^.]+(?:\.[^.]+)*?)(?:\.\s+[A-Z][a-z]+|\.\s*$)', re.DOTALL),
+    re.compile(r'(?:^|,\s*)([A-Z][^,]+(?:\.\s*[IVX]+\.)?[^,]*?)(?:,\s*(?:[A-Z]|$)|$)', re.DOTALL),
+]
+
+
+def _find_journal_abbreviation(text_lower: str) -> Optional[str]:
+    """
+    Find the longest journal abbreviation in a lowercased reference string.
+    
+    Abbreviations must match whole words/phrases: they start at the beginning
+    of the text or after whitespace/,;: and end at the end of the text or
+    before whitespace/,;:/a digit. Only those start positions are walked
+    through the abbreviation trie, so the cost does not grow with the size
+    of the abbreviation list.
+    """
+    trie = _get_journal_tables()[1]
+    best = None
+    length = len(text_lower)
+    
+    for start in range(length):
+        if start and not (text_lower[start - 1].isspace() or text_lower[start - 1] in ',;:'):
+            continue
+        node = trie
+        pos = start
+        while pos < length:
+            node = node.get(text_lower[pos])
+            if node is None:
+                break
+            pos += 1
+            entry = node.get('')
+            if entry and (best is None or entry > best):
+                following = text_lower[pos:pos + 1]
+                if not following or following.isspace() or following.isdecimal() or following in ',;:':
+                    best = entry
+    
+    return best[2] if best else None
+
+
 def parse_reference(text: str) -> Dict[str, Optional[str]]:
     """
     Parse a reference string and extract components like authors, year, title, journal, volume, pages.
@@ -745,46 +1707,23 @@ def parse_reference(text: str) -> Dict[str, Optional[str]]:
         return result
     
     # Extract year
-    year_patterns = [
-        r'\((\d{4})\)',  # (2021)
-        r'\b(19\d{2}|20\d{2})\b',  # standalone year
-    ]
-    for pattern in year_patterns:
-        match = re.search(pattern, text)
+    for pattern in _YEAR_PATTERNS:
+        match = pattern.search(text)
         if match:
             result['year'] = match.group(1)
             break
     
     # Extract volume and page numbers
-    vol_page_patterns = [
-        r'\b(\d+)\s*,\s*(\d+(?:[-–]\d+)?)\b',
-        r'\b(\d+)\s*:\s*(\d+(?:[-–]\d+)?)\b',
-        r'vol\.?\s*(\d+)\s*,?\s*(?:p\.?|pp\.?)?\s*(\d+(?:[-–]\d+)?)',
-        r'\b(\d+)\s*\([\d]+\)\s*[:,]?\s*(\d+(?:[-–]\d+)?)',
-    ]
-    for pattern in vol_page_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _VOL_PAGE_PATTERNS:
+        match = pattern.search(text)
         if match:
             result['volume'] = match.group(1)
             result['page'] = match.group(2)
             break
     
     # Extract authors
-    author_patterns = [
-        # "G. Thomas and M. J. Whelan" - initials before surname
-        r'^([A-Z]\.\s*(?:[A-Z]\.\s*)?[A-Za-z]+(?:\s+(?:and|&)\s+[A-Z]\.\s*(?:[A-Z]\.\s*)?[A-Za-z]+)*)',
-        # "Thomas, G." or "Thomas, G. and Whelan, M. J."
-        r'^([A-Za-z]+,?\s*[A-Z]\.(?:\s*[A-Z]\.)?(?:\s*(?:,|and|&)\s*[A-Za-z]+,?\s*[A-Z]\.(?:\s*[A-Z]\.)?)*)',
-        # "Ji B, Gao H" - surname + initial without period
-        r'^([A-Z][a-z]+\s+[A-Z](?:,\s*[A-Z][a-z]+\s+[A-Z])*)',
-        # "Smith AB, Jones CD" - surname + initials without periods
-        r'^([A-Z][a-z]+\s+[A-Z]{1,2}(?:,\s*[A-Z][a-z]+\s+[A-Z]{1,2})*)',
-        # "et al."
-        r'^([A-Za-z]+\s+et\s+al\.?)',
-    ]
-    
-    for pattern in author_patterns:
-        match = re.match(pattern, text)
+    for pattern in _AUTHOR_PATTERNS:
+        match = pattern.match(text)
         if match:
             result['authors'] = match.group(1).strip()
             remaining = text[match.end():].strip()
@@ -794,34 +1733,16 @@ def parse_reference(text: str) -> Dict[str, Optional[str]]:
             break
     
     # Check for journal abbreviations
-    # Need to match whole words/phrases, not substrings
     # Normalize whitespace (replace newlines with spaces) for matching
     text_normalized = ' '.join(text.split())
-    text_lower = text_normalized.lower()
-    best_match = None
-    best_match_len = 0
-    
-    for abbrev, full_name in JOURNAL_ABBREVIATIONS.items():
-        if abbrev.startswith('_'):  # Skip comment entries
-            continue
-        # Create pattern that matches whole word/phrase
-        # Escape special regex chars in abbreviation
-        escaped_abbrev = re.escape(abbrev)
-        # Match at word boundaries
-        pattern = r'(?:^|[\s,;:])(' + escaped_abbrev + r')(?:[\s,;:\d]|$)'
-        match = re.search(pattern, text_lower)
-        if match:
-            # Prefer longer matches (more specific)
-            if len(abbrev) > best_match_len:
-                best_match = full_name
-                best_match_len = len(abbrev)
+    best_match = _find_journal_abbreviation(text_normalized.lower())
     
     if best_match:
         result['journal'] = best_match
     
-    # Check for ALL CAPS journal name
-    if not result['journal']:
-        caps_match = re.match(r'^([A-Z][A-Z\s]+[A-Z])\b', text)
+    # Check for ALL CAPS journal name (cheap first-two-chars test before the regex)
+    if not result['journal'] and text[:2].isupper():
+        caps_match = _CAPS_JOURNAL_RE.match(text)
         if caps_match:
             journal_candidate = caps_match.group(1).strip()
             if len(journal_candidate) > 5 and ' ' in journal_candidate:
@@ -832,19 +1753,9 @@ def parse_reference(text: str) -> Dict[str, Optional[str]]:
         result['title'] = text
     
     # Try to extract title from quotes or after year
-    title_patterns = [
-        r'"([^"]+)"',
-        r"'([^']+)'",
-        # Title after year in parentheses: "(2023) Title here. Journal"
-        r'\(\d{4}\)\s+([A-Z][^.]+(?:\.[^.]+)*?)(?:\.\s+[A-Z][a-z]+\s|\.\s*$)',
-        # Title after year without parens: "2023. Title here. Journal"  
-        r'\d{4}[\.\)]\s*([A-Z][^.]+(?:\.[^.]+)*?)(?:\.\s+[A-Z][a-z]+|\.\s*$)',
-        r'(?:^|,\s*)([A-Z][^,]+(?:\.\s*[IVX]+\.)?[^,]*?)(?:,\s*(?:[A-Z]|$)|$)',
-    ]
-    
     if not result['title']:
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.DOTALL)
+        for pattern in _TITLE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 potential_title = match.group(1).strip()
                 # Clean up: remove newlines, multiple spaces
@@ -860,6 +1771,7 @@ def parse_reference(text: str) -> Dict[str, Optional[str]]:
 
 def format_search_result_short(item: Dict, index: int) -> str:
     """Format a search result for CLI display (compact)."""
+    item = _normalized(item)
     parts = [f"[{index}]"]
     
     if 'author' in item:
@@ -878,13 +1790,13 @@ def format_search_result_short(item: Dict, index: int) -> str:
         parts.append(f"({year})")
     
     if 'title' in item and item['title']:
-        title = item['title'][0] if isinstance(item['title'], list) else item['title']
+        title = item['title']
         if len(title) > 60:
             title = title[:57] + '...'
         parts.append(f'"{title}"')
     
     if 'container-title' in item and item['container-title']:
-        journal = item['container-title'][0] if isinstance(item['container-title'], list) else item['container-title']
+        journal = item['container-title']
         parts.append(journal)
     
     return ' '.join(parts)
@@ -892,6 +1804,7 @@ def format_search_result_short(item: Dict, index: int) -> str:
 
 def format_search_result_long(item: Dict) -> str:
     """Format a search result for GUI display (detailed)."""
+    item = _normalized(item)
     parts = []
     
     if 'author' in item:
@@ -910,13 +1823,13 @@ def format_search_result_long(item: Dict) -> str:
         parts.append(f"({year})")
     
     if 'title' in item and item['title']:
-        title = item['title'][0] if isinstance(item['title'], list) else item['title']
+        title = item['title']
         if len(title) > 80:
             title = title[:77] + '...'
         parts.append(f'"{title}"')
     
     if 'container-title' in item and item['container-title']:
-        journal = item['container-title'][0] if isinstance(item['container-title'], list) else item['container-title']
+        journal = item['container-title']
         parts.append(journal)
     
     vol_page = []
@@ -932,9 +1845,78 @@ def format_search_result_long(item: Dict) -> str:
 
 # ============== Clipboard ==============
 
+def _copy_to_clipboard_windows(text: str) -> bool:
+    """Copy text via the Win32 clipboard API (no child process)."""
+    import ctypes
+    from ctypes import wintypes
+    
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+    
+    user32 = ctypes.WinDLL('user32')
+    kernel32 = ctypes.WinDLL('kernel32')
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    
+    data = text.encode('utf-16-le') + b'\x00\x00'
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not handle:
+            return False
+        locked = kernel32.GlobalLock(handle)
+        if not locked:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(locked, data, len(data))
+        kernel32.GlobalUnlock(handle)
+        # On success the clipboard owns the memory
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)
+            return False
+        return True
+    finally:
+        user32.CloseClipboard()
+
+
+def _copy_to_clipboard_macos(text: str) -> bool:
+    """Copy text via NSPasteboard if PyObjC (AppKit) is available."""
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+    except ImportError:
+        return False
+    pasteboard = NSPasteboard.generalPasteboard()
+    pasteboard.clearContents()
+    return bool(pasteboard.setString_forType_(text, NSPasteboardTypeString))
+
+
 def copy_to_clipboard(text: str) -> bool:
-    """Copy text to clipboard using platform-specific method."""
-    system = platform.system()
+    """
+    Copy text to clipboard using platform-specific method.
+    
+    Uses the native clipboard API where possible and falls back to the
+    pbcopy / clip / xclip / xsel command-line tools otherwise.
+    """
+    system = _SYSTEM
+    try:
+        if system == 'Windows':
+            if _copy_to_clipboard_windows(text):
+                return True
+        elif system == 'Darwin':
+            if _copy_to_clipboard_macos(text):
+                return True
+    except Exception:
+        pass  # Fall back to the command-line tools below
+    
     try:
         if system == 'Darwin':  # macOS
             process = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
@@ -967,9 +1949,14 @@ def copy_to_clipboard_tk(text: str, root) -> bool:
 
 # ============== Paper Download & Open ==============
 
+# Characters replaced by '_' when a DOI is turned into a file name
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\-.]')
+
+
+@lru_cache(maxsize=None)
 def get_downloads_folder() -> str:
     """Get the standard Downloads folder for the current platform."""
-    if platform.system() == 'Windows':
+    if _SYSTEM == 'Windows':
         import winreg
         try:
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
@@ -986,38 +1973,135 @@ def get_unpaywall_pdf_url(doi: str, email: str = "bibtexer@example.com") -> Opti
     Query Unpaywall API to find open access PDF URL for a DOI.
     
     Unpaywall is a free service that finds legal open access versions of papers.
-    Returns the PDF URL if found, None otherwise.
+    Returns the PDF URL if found, None otherwise. Answers (including "no open
+    access copy") are kept in the local cache for CACHE_TTL_DAYS, after which
+    they are revalidated with a conditional request (ETag / Last-Modified).
+    Concurrent lookups of the same DOI share a single request.
     """
+    return _single_flight(('unpaywall', doi.lower()), _fetch_unpaywall_pdf_url, doi, email)
+
+
+def _fetch_unpaywall_pdf_url(doi: str, email: str) -> Optional[str]:
+    """Look up a DOI in the local cache or on Unpaywall (see get_unpaywall_pdf_url)."""
     url = f"https://api.unpaywall.org/v2/{urllib.parse.quote(doi, safe='')}?email={email}"
     
     req = urllib.request.Request(url)
     req.add_header('User-Agent', f'BibTexer/{__version__}')
+    req.add_header('Accept-Encoding', 'gzip')
+    
+    cached = _unpaywall_cache_get(doi)
+    if cached:
+        etag, modified, fetched_at, cached_url = cached
+        if time.time() - fetched_at < CACHE_TTL_DAYS * 86400:
+            return cached_url
+        if etag:
+            req.add_header('If-None-Match', etag)
+        if modified:
+            req.add_header('If-Modified-Since', modified)
     
     try:
-        with urllib.request.urlopen(req, timeout=15, context=ssl_context) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            
-            # Check for best open access location
-            best_oa = data.get('best_oa_location')
-            if best_oa:
-                pdf_url = best_oa.get('url_for_pdf')
-                if pdf_url:
-                    return pdf_url
-                # Fallback to landing page URL
-                return best_oa.get('url')
-            
-            # Check all OA locations
-            oa_locations = data.get('oa_locations', [])
-            for loc in oa_locations:
-                pdf_url = loc.get('url_for_pdf')
-                if pdf_url:
-                    return pdf_url
-            
-            return None
+        with _open_with_backoff(req, timeout=15, statuses=_UNPAYWALL_RETRY_STATUSES,
+                                base_delay=_UNPAYWALL_RETRY_DELAY) as response:
+            data = _read_json(response)
+            pdf_url = _find_oa_pdf_url(data)
+            _unpaywall_cache_put(
+                doi, pdf_url,
+                etag=response.headers.get('ETag'),
+                modified=response.headers.get('Last-Modified')
+            )
+            return pdf_url
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            # Unchanged - store it again to restart the TTL
+            _unpaywall_cache_put(doi, cached_url, etag=etag, modified=modified)
+            return cached_url
+        if e.code == 404:
+            # Unknown to Unpaywall - no need to ask again soon
+            _unpaywall_cache_put(doi, None, found=False)
+        return None
     except Exception:
         return None
 
 
+# Pause between lookups of one prefetch worker, to stay polite to Unpaywall
+_PREFETCH_DELAY = 0.05
+
+# Prefetching skips DOI prefixes (publishers) whose cached Unpaywall lookups
+# almost never turned up an OA copy, once there are enough of them to tell
+_PREFETCH_MIN_LOOKUPS = 20
+_PREFETCH_MIN_OA_RATE = 0.05
+
+
+def _unlikely_open_access(doi: str) -> bool:
+    """Whether earlier lookups say this DOI's publisher rarely has OA copies."""
+    lookups, hits = _unpaywall_prefix_stats(doi.split('/', 1)[0])
+    return lookups >= _PREFETCH_MIN_LOOKUPS and hits < _PREFETCH_MIN_OA_RATE * lookups
+
+
+# Prefetch lookups run on a few worker threads shared by all calls, and the
+# lookups not yet finished (see cancel_prefetches)
+_PREFETCH_WORKERS = 4
+_prefetch_pending = set()
+
+
+@lru_cache(maxsize=None)
+def _prefetch_executor() -> ThreadPoolExecutor:
+    """Return the prefetch worker pool, created on first use."""
+    return ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS)
+
+
+def _prefetch_one(doi: str):
+    """Warm the Unpaywall cache for one DOI (see prefetch_unpaywall)."""
+    if _unlikely_open_access(doi):
+        return
+    get_unpaywall_pdf_url(doi)
+    time.sleep(_PREFETCH_DELAY)
+
+
+def prefetch_unpaywall(dois: List[str]):
+    """
+    Warm the Unpaywall cache for several DOIs in the background.
+    
+    Returns immediately. The lookups are queued on a small pool of worker
+    threads and end up in the local cache, so downloading any of these
+    papers later does not have to wait for Unpaywall. DOIs from publishers
+    that have (so far) almost never had an open access copy are not
+    prefetched.
+    """
+    executor = _prefetch_executor()
+    for doi in dict.fromkeys(d for d in dois if d):
+        future = executor.submit(_prefetch_one, doi)
+        _prefetch_pending.add(future)
+        future.add_done_callback(_prefetch_pending.discard)
+
+
+def cancel_prefetches():
+    """Drop queued prefetch lookups (those already running still finish)."""
+    for future in list(_prefetch_pending):
+        future.cancel()
+
+
+def _find_oa_pdf_url(data: Dict) -> Optional[str]:
+    """Pick the best PDF (or landing page) URL from an Unpaywall record."""
+    # Check for best open access location
+    best_oa = data.get('best_oa_location')
+    if best_oa:
+        pdf_url = best_oa.get('url_for_pdf')
+        if pdf_url:
+            return pdf_url
+        # Fallback to landing page URL
+        return best_oa.get('url')
+    
+    # Check all OA locations
+    oa_locations = data.get('oa_locations', [])
+    for loc in oa_locations:
+        pdf_url = loc.get('url_for_pdf')
+        if pdf_url:
+            return pdf_url
+    
+    return None
+
+
 def download_pdf(url: str, doi: str, output_dir: Optional[str] = None) -> Optional[str]:
     """
     Download a PDF from URL to the specified directory.
@@ -1028,16 +2112,18 @@ def download_pdf(url: str, doi: str, output_dir: Optional[str] = None) -> Option
         output_dir = get_downloads_folder()
     
     # Create a safe filename from DOI
-    safe_doi = re.sub(r'[^\w\-.]', '_', doi)
+    safe_doi = _UNSAFE_FILENAME_RE.sub('_', doi)
     filename = f"{safe_doi}.pdf"
     filepath = os.path.join(output_dir, filename)
+    partial_path = filepath + '.part'
     
     req = urllib.request.Request(url)
     req.add_header('User-Agent', f'BibTexer/{__version__}')
     req.add_header('Accept', 'application/pdf,*/*')
+    req.add_header('Accept-Encoding', 'identity')  # PDFs are already compressed
     
     try:
-        with urllib.request.urlopen(req, timeout=60, context=ssl_context) as response:
+        with _OPENER.open(req, timeout=60) as response:
             content_type = response.headers.get('Content-Type', '')
             
             # Check if we got a PDF
@@ -1045,22 +2131,25 @@ def download_pdf(url: str, doi: str, output_dir: Optional[str] = None) -> Option
                 # Might be a redirect to HTML page, not a direct PDF
                 return None
             
-            with open(filepath, 'wb') as f:
-                f.write(response.read())
+            # Verify it's actually a PDF (check magic bytes) before writing anything
+            header = response.read(5)
+            if header != b'%PDF-':
+                return None
             
-            # Verify it's actually a PDF (check magic bytes)
-            with open(filepath, 'rb') as f:
-                header = f.read(5)
-                if header != b'%PDF-':
-                    os.remove(filepath)
-                    return None
+            # Stream the rest to disk instead of holding the whole file in memory.
+            # It goes to a temporary name first, so an interrupted download never
+            # leaves a truncated PDF (or replaces a good one) under the real name
+            with open(partial_path, 'wb') as f:
+                f.write(header)
+                shutil.copyfileobj(response, f, 64 * 1024)
+            os.replace(partial_path, filepath)
             
             return filepath
     except Exception:
         # Clean up partial download
-        if os.path.exists(filepath):
+        if os.path.exists(partial_path):
             try:
-                os.remove(filepath)
+                os.remove(partial_path)
             except Exception:
                 pass
         return None
@@ -1069,9 +2158,9 @@ def download_pdf(url: str, doi: str, output_dir: Optional[str] = None) -> Option
 def open_file(filepath: str) -> bool:
     """Open a file with the system's default application."""
     try:
-        if platform.system() == 'Darwin':  # macOS
+        if _SYSTEM == 'Darwin':  # macOS
             subprocess.run(['open', filepath], check=True)
-        elif platform.system() == 'Windows':
+        elif _SYSTEM == 'Windows':
             os.startfile(filepath)
         else:  # Linux
             subprocess.run(['xdg-open', filepath], check=True)
@@ -1083,13 +2172,9 @@ def open_file(filepath: str) -> bool:
 def open_url(url: str) -> bool:
     """Open a URL in the system's default browser."""
     try:
-        if platform.system() == 'Darwin':  # macOS
-            subprocess.run(['open', url], check=True)
-        elif platform.system() == 'Windows':
-            os.startfile(url)
-        else:  # Linux
-            subprocess.run(['xdg-open', url], check=True)
-        return True
+        # webbrowser resolves the browser once and launches it directly,
+        # instead of waiting on an open/xdg-open helper for every URL
+        return webbrowser.open(url, new=2)
     except Exception:
         return False
 
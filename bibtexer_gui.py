@@ -10,13 +10,18 @@ Requirements: pip install customtkinter
 
 import sys
 import subprocess
-import threading
 import tkinter as tk
-from typing import List, Dict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 
 try:
     import customtkinter as ctk
 except ImportError:
+    if __name__ != "__main__":
+        # Imported as a module: report the missing dependency, don't install it
+        raise
     print("CustomTkinter not found. Installing...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "customtkinter"])
     import customtkinter as ctk
@@ -24,14 +29,22 @@ except ImportError:
 from bibtexer_core import (
     __version__,
     clean_doi,
+    is_doi,
     get_crossref_data,
+    clear_lookup_caches,
+    report_retries,
+    _cache_get_fresh,
     search_crossref,
     convert_to_bibtex,
     convert_to_ris,
+    get_year,
+    normalize_record,
     parse_reference,
     format_search_result_long,
     copy_to_clipboard_tk,
     download_or_open_paper,
+    prefetch_unpaywall,
+    cancel_prefetches,
     open_url,
     get_doi_url,
     is_zotero_running,
@@ -39,26 +52,79 @@ from bibtexer_core import (
 )
 
 
+@lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Return a shared CTkFont, so identical fonts are registered with Tk only once."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+def _set_label(label: ctk.CTkLabel, text: str, text_color):
+    """Configure a label's text and color, skipping the redraw if neither changed."""
+    if label.cget("text") != text or label.cget("text_color") != text_color:
+        label.configure(text=text, text_color=text_color)
+
+
+def _result_lines(item: Dict) -> Tuple[str, str, str]:
+    """
+    Format a CrossRef search result as the (title, authors, meta) lines
+    shown in SearchResultsDialog.
+    
+    Plain string work with no Tk calls, so it can run off the UI thread.
+    """
+    # Extract info (title and journal come as lists from CrossRef)
+    item = normalize_record(dict(item))
+    title = item.get('title', 'No title')
+    
+    authors = item.get('author', [])
+    if authors:
+        author_names = []
+        for a in authors[:3]:
+            name = f"{a.get('family', '')}, {a.get('given', '')}"
+            author_names.append(name.strip(', '))
+        author_str = "; ".join(author_names)
+        if len(authors) > 3:
+            author_str += f" et al. ({len(authors)} authors)"
+    else:
+        author_str = "Unknown authors"
+    
+    year = get_year(item)
+    
+    journal = item.get('container-title', '')
+    doi = item.get('DOI', '')
+    
+    # Line 3: Journal, Year, DOI
+    meta_parts = []
+    if journal:
+        meta_parts.append(journal)
+    if year:
+        meta_parts.append(f"({year})")
+    if doi:
+        meta_parts.append(f"DOI: {doi}")
+    
+    return title, author_str, ' • '.join(meta_parts)
+
+
 class SearchResultsDialog(tk.Toplevel):
     """Dialog to display and select from search results."""
     
-    def __init__(self, parent, results: List[Dict], callback):
+    WIDTH = 900
+    HEIGHT = 550
+    
+    def __init__(self, parent, results: List[Dict], callback,
+                 lines: Optional[List[Tuple[str, str, str]]] = None, dark: bool = False):
         super().__init__(parent)
         
-        self.results = results
+        self.results = []
         self.selected_item = None
         self.selected_index = None
         self.callback = callback
+        self._dark = None  # appearance the colors were last set for
         
         # Basic window setup
         self.title("Select Reference")
-        self.geometry("900x550")
+        self.geometry(f"{self.WIDTH}x{self.HEIGHT}")
         self.minsize(700, 400)
         
-        # Set background color based on appearance mode
-        bg_color = "#2b2b2b" if ctk.get_appearance_mode() == "Dark" else "#f0f0f0"
-        self.configure(bg=bg_color)
-        
         # Make modal
         self.transient(parent)
         
@@ -67,55 +133,50 @@ class SearchResultsDialog(tk.Toplevel):
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Title
-        title_label = ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             main_frame,
-            text=f"Found {len(results)} matching references",
-            font=ctk.CTkFont(size=16, weight="bold")
+            text="",
+            font=_font(16, "bold")
         )
-        title_label.pack(pady=(10, 5))
+        self.title_label.pack(pady=(10, 5))
         
         instruction_label = ctk.CTkLabel(
             main_frame,
             text="Click to select, then 'Use Selected' or double-click to confirm",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         instruction_label.pack(pady=(0, 10))
         
-        # Results list with canvas for scrolling
+        # Results list: one read-only tk.Text with a tagged block per result,
+        # instead of a frame and three labels per result
         list_frame = ctk.CTkFrame(main_frame)
         list_frame.pack(fill="both", expand=True, padx=5, pady=5)
         
-        # Canvas with scrollbars
-        canvas_bg = "#333333" if ctk.get_appearance_mode() == "Dark" else "#e8e8e8"
-        self.canvas = tk.Canvas(list_frame, highlightthickness=0, bg=canvas_bg)
+        self.results_text = tk.Text(
+            list_frame,
+            wrap="word",
+            cursor="hand2",
+            relief="flat",
+            highlightthickness=0,
+            padx=10,
+            pady=5
+        )
         
-        # Scrollbars
-        v_scrollbar = ctk.CTkScrollbar(list_frame, orientation="vertical", command=self.canvas.yview)
+        v_scrollbar = ctk.CTkScrollbar(list_frame, orientation="vertical", command=self.results_text.yview)
         v_scrollbar.pack(side="right", fill="y")
         
-        h_scrollbar = ctk.CTkScrollbar(list_frame, orientation="horizontal", command=self.canvas.xview)
-        h_scrollbar.pack(side="bottom", fill="x")
-        
-        self.canvas.pack(side="left", fill="both", expand=True)
-        self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.results_text.pack(side="left", fill="both", expand=True)
+        self.results_text.configure(yscrollcommand=v_scrollbar.set)
         
-        # Inner frame for content
-        self.inner_frame = ctk.CTkFrame(self.canvas, fg_color="transparent")
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
+        self.results_text.tag_configure("title", font=_font(12, "bold"), spacing1=5)
+        self.results_text.tag_configure("authors", font=_font(11), lmargin1=20, lmargin2=20)
+        self.results_text.tag_configure("meta", font=_font(10), lmargin1=20, lmargin2=20, spacing3=5)
         
-        # Create result items with multi-line format
-        self.result_frames = []
-        for i, item in enumerate(results):
-            result_frame = self._create_result_item(i, item)
-            self.result_frames.append(result_frame)
-        
-        # Update scroll region
-        self.inner_frame.bind("<Configure>", self._on_frame_configure)
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
-        
-        # Mouse wheel scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Shift-MouseWheel>", self._on_shift_mousewheel)
+        # One click handler for the whole list; "break" keeps Tk's own text
+        # selection from kicking in
+        self.results_text.bind("<Button-1>", self._on_results_click)
+        self.results_text.bind("<Double-Button-1>", self._on_results_double_click)
+        self.results_text.bind("<B1-Motion>", lambda e: "break")
         
         # Button frame
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -126,7 +187,7 @@ class SearchResultsDialog(tk.Toplevel):
             text="Use Selected",
             command=self.use_selected,
             state="disabled",
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         self.use_button.pack(side="left", padx=(0, 10))
         
@@ -135,105 +196,103 @@ class SearchResultsDialog(tk.Toplevel):
             text="Cancel",
             command=self.cancel,
             fg_color="gray",
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         cancel_button.pack(side="left")
         
         # Handle window close
         self.protocol("WM_DELETE_WINDOW", self.cancel)
         
-        # Center and show
-        self.after(50, self._finalize_window)
-    
-    def _create_result_item(self, index: int, item: Dict) -> ctk.CTkFrame:
-        """Create a multi-line result item."""
-        frame = ctk.CTkFrame(
-            self.inner_frame,
-            fg_color="transparent",
-            corner_radius=5
-        )
-        frame.pack(fill="x", padx=5, pady=3)
-        
-        # Extract info
-        title = item.get('title', ['No title'])[0] if isinstance(item.get('title'), list) else item.get('title', 'No title')
-        
-        authors = item.get('author', [])
-        if authors:
-            author_names = []
-            for a in authors[:3]:
-                name = f"{a.get('family', '')}, {a.get('given', '')}"
-                author_names.append(name.strip(', '))
-            author_str = "; ".join(author_names)
-            if len(authors) > 3:
-                author_str += f" et al. ({len(authors)} authors)"
-        else:
-            author_str = "Unknown authors"
-        
-        year = ""
-        if 'published-print' in item:
-            year = str(item['published-print'].get('date-parts', [['']])[0][0])
-        elif 'published-online' in item:
-            year = str(item['published-online'].get('date-parts', [['']])[0][0])
-        elif 'issued' in item:
-            year = str(item['issued'].get('date-parts', [['']])[0][0])
-        
-        journal = item.get('container-title', [''])[0] if isinstance(item.get('container-title'), list) else item.get('container-title', '')
-        doi = item.get('DOI', '')
-        
-        # Line 1: Title (bold)
-        title_label = ctk.CTkLabel(
-            frame,
-            text=f"{index + 1}. {title}",
-            font=ctk.CTkFont(size=12, weight="bold"),
-            anchor="w",
-            wraplength=800
-        )
-        title_label.pack(fill="x", padx=10, pady=(5, 0))
-        
-        # Line 2: Authors
-        author_label = ctk.CTkLabel(
-            frame,
-            text=f"    {author_str}",
-            font=ctk.CTkFont(size=11),
-            anchor="w",
-            text_color=("gray30", "gray70")
-        )
-        author_label.pack(fill="x", padx=10, pady=0)
-        
-        # Line 3: Journal, Year, DOI
-        meta_parts = []
-        if journal:
-            meta_parts.append(journal)
-        if year:
-            meta_parts.append(f"({year})")
-        if doi:
-            meta_parts.append(f"DOI: {doi}")
-        
-        meta_label = ctk.CTkLabel(
-            frame,
-            text=f"    {' • '.join(meta_parts)}",
-            font=ctk.CTkFont(size=10),
-            anchor="w",
-            text_color=("gray40", "gray60")
-        )
-        meta_label.pack(fill="x", padx=10, pady=(0, 5))
+        self.show_results(results, callback, lines, dark)
+    
+    def show_results(self, results: List[Dict], callback,
+                     lines: Optional[List[Tuple[str, str, str]]] = None, dark: bool = False):
+        """
+        Fill the dialog with a set of results and show it.
+        
+        Used for the first search and again for later ones, so the dialog's
+        widgets are built only once per session. dark is the app's current
+        appearance; the colors are only changed when it differs from the
+        last show.
+        """
+        self.results = results
+        self.selected_item = None
+        self.selected_index = None
+        self.callback = callback
         
-        # Make entire frame clickable
-        for widget in [frame, title_label, author_label, meta_label]:
-            widget.bind("<Button-1>", lambda e, idx=index: self.select_result(idx))
-            widget.bind("<Double-Button-1>", lambda e, idx=index: self.confirm_selection(idx))
+        self._apply_appearance(dark)
+        self.title_label.configure(text=f"Found {len(results)} matching references")
+        
+        # Create result items with multi-line format (callers normally pass
+        # the lines formatted in advance, leaving only inserts for the UI thread)
+        if lines is None:
+            lines = [_result_lines(item) for item in results]
+        self.results_text.configure(state="normal")
+        self.results_text.delete("1.0", "end")
+        for i, item_lines in enumerate(lines):
+            self._insert_result_item(i, item_lines)
+        self.results_text.configure(state="disabled")
+        self.results_text.yview_moveto(0)
+        self.use_button.configure(state="disabled")
         
-        return frame
+        # Center and show
+        self._finalize_window()
+    
+    def _apply_appearance(self, dark: bool):
+        """Set the colors for the light or dark appearance, unless already set."""
+        if dark == self._dark:
+            return
+        self._dark = dark
+        self.configure(bg="#2b2b2b" if dark else "#f0f0f0")
+        self.results_text.configure(
+            bg="#333333" if dark else "#e8e8e8",
+            fg="#ffffff" if dark else "#000000"
+        )
+        self.results_text.tag_configure("authors", foreground="gray70" if dark else "gray30")
+        self.results_text.tag_configure("meta", foreground="gray60" if dark else "gray40")
+        self.results_text.tag_configure("selected", background="gray35" if dark else "gray75")
+    
+    def _insert_result_item(self, index: int, lines: Tuple[str, str, str]):
+        """Append a multi-line result item to the results list."""
+        title, author_str, meta = lines
+        
+        # Title (bold), authors, then journal/year/DOI - all tagged with the
+        # result index so clicks can be mapped back to the result
+        item_tag = f"result{index}"
+        self.results_text.insert("end", f"{index + 1}. {title}\n", ("title", item_tag))
+        self.results_text.insert("end", f"{author_str}\n", ("authors", item_tag))
+        self.results_text.insert("end", f"{meta}\n", ("meta", item_tag))
+    
+    def _result_index_at(self, event) -> Optional[int]:
+        """Return the index of the result under the mouse, if any."""
+        position = self.results_text.index(f"@{event.x},{event.y}")
+        for tag in self.results_text.tag_names(position):
+            if tag.startswith("result"):
+                return int(tag[len("result"):])
+        return None
+    
+    def _on_results_click(self, event):
+        """Select the clicked result."""
+        index = self._result_index_at(event)
+        if index is not None:
+            self.select_result(index)
+        return "break"
+    
+    def _on_results_double_click(self, event):
+        """Confirm the double-clicked result."""
+        index = self._result_index_at(event)
+        if index is not None:
+            self.confirm_selection(index)
+        return "break"
     
     def _finalize_window(self):
         """Center and show window."""
         try:
-            self.update_idletasks()
-            
-            # Center on parent
+            # Center on parent, using the size set in __init__ rather than
+            # forcing a synchronous layout pass to measure the dialog
             parent = self.master
-            x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-            y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+            x = parent.winfo_x() + (parent.winfo_width() - self.WIDTH) // 2
+            y = parent.winfo_y() + (parent.winfo_height() - self.HEIGHT) // 2
             x = max(0, x)
             y = max(0, y)
             self.geometry(f"+{x}+{y}")
@@ -243,44 +302,28 @@ class SearchResultsDialog(tk.Toplevel):
             self.lift()
             self.focus_force()
             
-            # Set grab
-            self.after(100, self._setup_grab)
+            # Set grab as soon as Tk is idle (the window is mapped by then)
+            self.after_idle(self._setup_grab)
         except Exception:
             pass
     
     def _setup_grab(self):
-        """Setup modal grab."""
+        """Setup modal grab, waiting until the window is viewable."""
         try:
+            if not self.winfo_viewable():
+                # Some window managers map the window a little later
+                if self.state() != "withdrawn":
+                    self.after(20, self._setup_grab)
+                return
             self.grab_set()
         except Exception:
             pass
     
-    def _on_frame_configure(self, event):
-        """Update scroll region."""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-    
-    def _on_canvas_configure(self, event):
-        """Adjust inner frame width."""
-        canvas_width = event.width
-        frame_width = self.inner_frame.winfo_reqwidth()
-        if canvas_width > frame_width:
-            self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-    
-    def _on_mousewheel(self, event):
-        """Vertical scroll."""
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-    
-    def _on_shift_mousewheel(self, event):
-        """Horizontal scroll."""
-        self.canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
-    
     def select_result(self, index: int):
         """Highlight selected result."""
-        for i, frame in enumerate(self.result_frames):
-            if i == index:
-                frame.configure(fg_color=("gray75", "gray35"))
-            else:
-                frame.configure(fg_color="transparent")
+        self.results_text.tag_remove("selected", "1.0", "end")
+        self.results_text.tag_add("selected", *self.results_text.tag_ranges(f"result{index}"))
+        self.results_text.tag_raise("selected")
         self.selected_index = index
         self.use_button.configure(state="normal")
     
@@ -293,18 +336,18 @@ class SearchResultsDialog(tk.Toplevel):
         """Use selected result."""
         if self.selected_index is not None:
             self.selected_item = self.results[self.selected_index]
-            # Unbind events
-            self.canvas.unbind_all("<MouseWheel>")
-            self.canvas.unbind_all("<Shift-MouseWheel>")
             self.callback(self.selected_item)
-            self.destroy()
+            self._close()
     
     def cancel(self):
         """Cancel selection."""
-        self.canvas.unbind_all("<MouseWheel>")
-        self.canvas.unbind_all("<Shift-MouseWheel>")
         self.callback(None)
-        self.destroy()
+        self._close()
+    
+    def _close(self):
+        """Hide the dialog, keeping it for the next search."""
+        self.grab_release()
+        self.withdraw()
 
 
 class BibTexerApp(ctk.CTk):
@@ -320,12 +363,36 @@ class BibTexerApp(ctk.CTk):
         ctk.set_appearance_mode("system")
         ctk.set_default_color_theme("blue")
         
+        # Resolved appearance, looked up once and updated by toggle_theme
+        self._dark = ctk.get_appearance_mode() == "Dark"
+        
         # Store current data
         self.current_bibtex = ""
         self.current_ris = ""
         self.current_doi = None
         self.current_crossref_data = None  # Store raw CrossRef data for Zotero
         
+        # Pending background prefetch of the DOI being typed/pasted, its job on
+        # the worker pool, and the last DOI prefetched (so focus changes don't
+        # fetch it again)
+        self._prefetch_after_id = None
+        self._prefetch_future = None
+        self._prefetched_doi = None
+        
+        # Search results dialog, created on first use and then reused
+        self._results_dialog = None
+        
+        # Worker threads for network calls, reused across button clicks, and
+        # the jobs not yet finished (cancelled when the window closes)
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._pending_jobs = set()
+        self._closed = False
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # UI updates posted by worker threads, applied together when Tk is idle
+        self._ui_queue = deque()
+        self._ui_pending = False
+        
         # Create scrollable main frame for smaller screens
         self.main_frame = ctk.CTkScrollableFrame(self)
         self.main_frame.pack(fill="both", expand=True, padx=5, pady=5)
@@ -334,14 +401,14 @@ class BibTexerApp(ctk.CTk):
         self.title_label = ctk.CTkLabel(
             self.main_frame, 
             text="BibTexer", 
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         self.title_label.pack(pady=(10, 5))
         
         self.subtitle_label = ctk.CTkLabel(
             self.main_frame, 
             text="Convert references to BibTeX/RIS • Download papers • Add to Zotero",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.subtitle_label.pack(pady=(0, 5))
         
@@ -349,7 +416,7 @@ class BibTexerApp(ctk.CTk):
         self.attribution_label = ctk.CTkLabel(
             self.main_frame, 
             text="Part of the MatWerk Scholar Toolbox • NFDI-MatWerk",
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             text_color="gray"
         )
         self.attribution_label.pack(pady=(0, 10))
@@ -373,7 +440,7 @@ class BibTexerApp(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             self.main_frame, 
             text="",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.status_label.pack(pady=5)
         
@@ -388,7 +455,7 @@ class BibTexerApp(ctk.CTk):
         self.output_label = ctk.CTkLabel(
             output_header_frame, 
             text="Output:",
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         self.output_label.pack(side="left")
         
@@ -401,7 +468,7 @@ class BibTexerApp(ctk.CTk):
         format_label = ctk.CTkLabel(
             format_frame,
             text="Format:",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         format_label.pack(side="left", padx=(0, 10))
         
@@ -411,7 +478,7 @@ class BibTexerApp(ctk.CTk):
             variable=self.format_var,
             value="bibtex",
             command=self._on_format_change,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.bibtex_radio.pack(side="left", padx=(0, 10))
         
@@ -421,13 +488,13 @@ class BibTexerApp(ctk.CTk):
             variable=self.format_var,
             value="ris",
             command=self._on_format_change,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.ris_radio.pack(side="left")
         
         # Output text area - use tk.Text for reliability in bundled apps
-        text_bg = "#2b2b2b" if ctk.get_appearance_mode() == "Dark" else "#ffffff"
-        text_fg = "#ffffff" if ctk.get_appearance_mode() == "Dark" else "#000000"
+        text_bg = "#2b2b2b" if self._dark else "#ffffff"
+        text_fg = "#ffffff" if self._dark else "#000000"
         self.output_text = tk.Text(
             self.output_frame, 
             font=("Courier", 12),
@@ -449,7 +516,7 @@ class BibTexerApp(ctk.CTk):
             command=self.copy_to_clipboard,
             height=35,
             width=100,
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         self.copy_button.pack(side="left", padx=(0, 8))
         
@@ -458,7 +525,7 @@ class BibTexerApp(ctk.CTk):
             text="📄 Open Access",
             command=self.download_open_access,
             height=35,
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             fg_color="#28a745",
             width=130
         )
@@ -469,7 +536,7 @@ class BibTexerApp(ctk.CTk):
             text="🏛️ Journal",
             command=self.open_journal_page,
             height=35,
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             fg_color="#0066cc",
             width=110
         )
@@ -482,19 +549,30 @@ class BibTexerApp(ctk.CTk):
             height=35,
             width=80,
             fg_color="gray",
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
-        self.clear_button.pack(side="left", padx=(0, 15))
+        self.clear_button.pack(side="left", padx=(0, 8))
+        
+        self.refresh_button = ctk.CTkButton(
+            self.button_frame, 
+            text="⟳ Refresh",
+            command=self.refresh_lookups,
+            height=35,
+            width=90,
+            fg_color="gray",
+            font=_font(13)
+        )
+        self.refresh_button.pack(side="left", padx=(0, 15))
         
         # Theme toggle
         self.theme_switch = ctk.CTkSwitch(
             self.button_frame,
             text="Dark Mode",
             command=self.toggle_theme,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.theme_switch.pack(side="right")
-        if ctk.get_appearance_mode() == "Dark":
+        if self._dark:
             self.theme_switch.select()
         
         # Export section (NEW in v4.0)
@@ -510,7 +588,7 @@ class BibTexerApp(ctk.CTk):
         export_label = ctk.CTkLabel(
             self.main_frame,
             text="Export",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=_font(12, "bold"),
             text_color="gray"
         )
         export_label.pack(pady=(5, 5))
@@ -525,7 +603,7 @@ class BibTexerApp(ctk.CTk):
             command=self.add_to_zotero,
             height=35,
             width=150,
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             fg_color="#cc2936"
         )
         self.zotero_button.pack(side="left", padx=(0, 10))
@@ -534,7 +612,7 @@ class BibTexerApp(ctk.CTk):
         self.zotero_status_label = ctk.CTkLabel(
             export_frame,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color="gray"
         )
         self.zotero_status_label.pack(side="left")
@@ -542,19 +620,59 @@ class BibTexerApp(ctk.CTk):
         # Check Zotero status on startup
         self._check_zotero_status()
     
+    def _run_on_ui(self, func, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) on the Tk thread. Updates posted in a burst
+        (status, output, button state) are applied in one idle callback, so
+        Tk redraws once. Does nothing once the window has been closed.
+        """
+        if self._closed:
+            return
+        self._ui_queue.append((func, args, kwargs))
+        if not self._ui_pending:
+            self._ui_pending = True
+            try:
+                self.after_idle(self._drain_ui_queue)
+            except (tk.TclError, RuntimeError):
+                pass  # The window was destroyed in the meantime
+    
+    def _drain_ui_queue(self):
+        """
+        Apply all queued UI updates. An update that fails is reported the way
+        Tk reports failing callbacks, and the rest of the batch still runs.
+        """
+        self._ui_pending = False
+        while self._ui_queue:
+            func, args, kwargs = self._ui_queue.popleft()
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                self.report_callback_exception(*sys.exc_info())
+    
+    def _submit(self, func, *args):
+        """Run func(*args) on a worker thread, tracked until it finishes."""
+        future = self._executor.submit(func, *args)
+        self._pending_jobs.add(future)
+        future.add_done_callback(self._pending_jobs.discard)
+        return future
+    
+    def _post_status(self, message, status_type="info"):
+        """Set the status line from a worker thread."""
+        self._run_on_ui(self.set_status, message, status_type)
+    
+    def _report_retry(self, retry, retries, delay):
+        """Show on the status line that a request is being retried."""
+        self._post_status(f"Server busy or unreachable, retrying ({retry}/{retries})...", "warning")
+    
     def _check_zotero_status(self):
         """Check if Zotero is running and update status."""
         def check():
             running = is_zotero_running()
             status_text = "● Zotero detected" if running else "○ Zotero not running"
             status_color = "#28a745" if running else "gray"
-            self.after(0, lambda: self.zotero_status_label.configure(
-                text=status_text, 
-                text_color=status_color
-            ))
+            self._run_on_ui(_set_label, self.zotero_status_label, status_text, status_color)
         
-        thread = threading.Thread(target=check)
-        thread.start()
+        self._submit(check)
     
     def _setup_doi_tab(self):
         """Setup the DOI lookup tab."""
@@ -564,7 +682,7 @@ class BibTexerApp(ctk.CTk):
         doi_label = ctk.CTkLabel(
             doi_frame, 
             text="Enter DOI:",
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         doi_label.pack(anchor="w", padx=10, pady=(10, 5))
         
@@ -575,10 +693,13 @@ class BibTexerApp(ctk.CTk):
             entry_button_frame, 
             placeholder_text="e.g., 10.1038/nature12373 or https://doi.org/...",
             height=40,
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         self.doi_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         self.doi_entry.bind("<Return>", lambda e: self.convert_doi())
+        self.doi_entry.bind("<KeyRelease>", self._schedule_prefetch)
+        self.doi_entry.bind("<<Paste>>", self._schedule_prefetch)
+        self.doi_entry.bind("<FocusOut>", lambda e: self._schedule_prefetch(delay=0))
         
         self.convert_button = ctk.CTkButton(
             entry_button_frame, 
@@ -586,7 +707,7 @@ class BibTexerApp(ctk.CTk):
             command=self.convert_doi,
             height=40,
             width=100,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         self.convert_button.pack(side="right")
     
@@ -598,7 +719,7 @@ class BibTexerApp(ctk.CTk):
         instruction_label = ctk.CTkLabel(
             search_frame, 
             text="Enter any reference information (authors, title, journal, year, etc.):",
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         instruction_label.pack(anchor="w", padx=10, pady=(10, 5))
         
@@ -610,7 +731,7 @@ class BibTexerApp(ctk.CTk):
         examples_label = ctk.CTkLabel(
             search_frame, 
             text=examples_text,
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             justify="left",
             text_color="gray"
         )
@@ -619,7 +740,7 @@ class BibTexerApp(ctk.CTk):
         self.search_entry = ctk.CTkTextbox(
             search_frame, 
             height=80,
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             wrap="word"
         )
         self.search_entry.pack(fill="x", padx=10, pady=(0, 10))
@@ -633,14 +754,14 @@ class BibTexerApp(ctk.CTk):
             command=self.search_reference,
             height=40,
             width=150,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         self.search_button.pack(side="left")
         
         self.parsed_label = ctk.CTkLabel(
             search_frame, 
             text="",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             justify="left",
             text_color="gray"
         )
@@ -650,22 +771,63 @@ class BibTexerApp(ctk.CTk):
         """Handle format radio button change."""
         self._update_output_display()
     
+    def _get_current_ris(self) -> str:
+        """Return the RIS for the current record, converting it on first use."""
+        if self.current_ris is None:
+            self.current_ris = convert_to_ris(self.current_crossref_data) if self.current_crossref_data else ""
+        return self.current_ris
+    
     def _update_output_display(self):
         """Update the output text based on selected format."""
         if self.format_var.get() == "bibtex":
             self._update_output(self.current_bibtex)
         else:
-            self._update_output(self.current_ris)
-        self.update()  # Force full update
+            self._update_output(self._get_current_ris())
     
     def toggle_theme(self):
-        if self.theme_switch.get():
+        self._dark = bool(self.theme_switch.get())
+        if self._dark:
             ctk.set_appearance_mode("dark")
             self.output_text.configure(bg="#2b2b2b", fg="#ffffff", insertbackground="#ffffff")
         else:
             ctk.set_appearance_mode("light")
             self.output_text.configure(bg="#ffffff", fg="#000000", insertbackground="#000000")
     
+    def _schedule_prefetch(self, event=None, delay=500):
+        """
+        Prefetch the entered DOI once typing/pasting has paused for 500 ms,
+        or right away (delay=0) when the field loses focus. A prefetch of the
+        previous input that has not started yet is cancelled.
+        """
+        if self._prefetch_after_id is not None:
+            self.after_cancel(self._prefetch_after_id)
+        if self._prefetch_future is not None:
+            self._prefetch_future.cancel()
+            self._prefetch_future = None
+        self._prefetch_after_id = self.after(delay, self._prefetch_doi)
+    
+    def _prefetch_doi(self):
+        """Fetch the entered DOI in the background so Convert and Download OA find it cached."""
+        self._prefetch_after_id = None
+        doi = clean_doi(self.doi_entry.get())
+        if not is_doi(doi) or doi == self._prefetched_doi:
+            return
+        self._prefetched_doi = doi
+        
+        if _cache_get_fresh(doi) is None:
+            self._prefetch_future = self._submit(self._prefetch_thread, doi)
+        else:
+            prefetch_unpaywall([doi])
+    
+    def _prefetch_thread(self, doi):
+        # Unpaywall is only asked once CrossRef knows the DOI, so input that is
+        # still being typed never leaves "not found" answers in the cache
+        try:
+            get_crossref_data(doi)
+        except Exception:
+            return  # Convert will report any error
+        prefetch_unpaywall([doi])
+    
     def convert_doi(self):
         doi = self.doi_entry.get().strip()
         
@@ -678,18 +840,21 @@ class BibTexerApp(ctk.CTk):
         self.convert_button.configure(state="disabled", text="Loading...")
         self.set_status("Fetching data from CrossRef...", "info")
         
-        thread = threading.Thread(target=self._fetch_and_convert, args=(doi,))
-        thread.start()
+        self._submit(self._fetch_and_convert, doi)
+        
+        # Look up the open access copy alongside the CrossRef request, so
+        # "Download OA" does not have to wait for Unpaywall afterwards
+        prefetch_unpaywall([doi])
     
     def _fetch_and_convert(self, doi):
         try:
-            data = get_crossref_data(doi)
+            with report_retries(self._report_retry):
+                data = get_crossref_data(doi)
             bibtex = convert_to_bibtex(data)
-            ris = convert_to_ris(data)
             
             # Store data
             self.current_bibtex = bibtex
-            self.current_ris = ris
+            self.current_ris = None  # converted when first shown or copied
             self.current_doi = data.get('DOI', doi)
             self.current_crossref_data = data
             
@@ -700,20 +865,19 @@ class BibTexerApp(ctk.CTk):
                 self._check_zotero_status()
                 self.convert_button.configure(state="normal", text="Convert")
             
-            self.after(0, update_ui)
+            self._run_on_ui(update_ui)
             
         except ValueError as e:
-            def show_error():
-                self.set_status(f"Error: {e}", "error")
-                self._update_output("")
-                self.convert_button.configure(state="normal", text="Convert")
-            self.after(0, show_error)
+            self._post_status(f"Error: {e}", "error")
+            self._convert_failed()
         except Exception as e:
-            def show_error():
-                self.set_status(f"Unexpected error: {e}", "error")
-                self._update_output("")
-                self.convert_button.configure(state="normal", text="Convert")
-            self.after(0, show_error)
+            self._post_status(f"Unexpected error: {e}", "error")
+            self._convert_failed()
+    
+    def _convert_failed(self):
+        """Clear the output and re-enable Convert after a failed lookup (worker thread)."""
+        self._run_on_ui(self._update_output, "")
+        self._run_on_ui(self.convert_button.configure, state="normal", text="Convert")
     
     def search_reference(self):
         """Search for a reference using parsed information."""
@@ -748,40 +912,56 @@ class BibTexerApp(ctk.CTk):
         
         self.search_button.configure(state="disabled", text="Searching...")
         self.set_status("Searching CrossRef...", "info")
-        self.update()  # Force UI update
         
-        # Perform search directly (no threading) to debug
+        # Search in a worker thread; Tk repaints the status while it runs
+        self._submit(self._search_thread, parsed)
+    
+    def _search_thread(self, parsed: Dict):
+        """Search CrossRef off the UI thread and hand the results back to it."""
         try:
-            results = search_crossref(
-                query=parsed['query'] if not parsed['title'] and not parsed['authors'] else None,
-                author=parsed['authors'],
-                title=parsed['title'],
-                journal=parsed['journal'],
-                year=parsed['year'],
-                rows=15
-            )
+            with report_retries(self._report_retry):
+                results = search_crossref(
+                    query=parsed['query'] if not parsed['title'] and not parsed['authors'] else None,
+                    author=parsed['authors'],
+                    title=parsed['title'],
+                    journal=parsed['journal'],
+                    year=parsed['year'],
+                    rows=15
+                )
+            
+            # Look up open access copies while the user picks a result
+            prefetch_unpaywall([item.get('DOI') for item in results])
+            
+            lines = [_result_lines(item) for item in results]
+            
+            def show_results():
+                self.search_button.configure(state="normal", text="Search CrossRef")
+                if not results:
+                    self.set_status("No results found", "warning")
+                    self._update_output("")
+                elif len(results) == 1:
+                    self._process_selected_result(results[0])
+                else:
+                    self._show_search_results(results, lines)
+            
+            self._run_on_ui(show_results)
             
-            if not results:
-                self.set_status("No results found", "warning")
-                self._update_output("")
-            elif len(results) == 1:
-                self._process_selected_result(results[0])
-            else:
-                self._show_search_results(results)
-                
         except Exception as e:
-            self.set_status(f"Error: {e}", "error")
-            self._update_output("")
-        finally:
-            self.search_button.configure(state="normal", text="Search CrossRef")
+            message = f"Error: {e}"
+            
+            def show_error():
+                self.search_button.configure(state="normal", text="Search CrossRef")
+                self.set_status(message, "error")
+                self._update_output("")
+            
+            self._run_on_ui(show_error)
     
     def _process_selected_result(self, data: Dict):
         """Process a selected search result."""
         bibtex = convert_to_bibtex(data)
-        ris = convert_to_ris(data)
         
         self.current_bibtex = bibtex
-        self.current_ris = ris
+        self.current_ris = None  # converted when first shown or copied
         self.current_doi = data.get('DOI')
         self.current_crossref_data = data
         
@@ -789,21 +969,29 @@ class BibTexerApp(ctk.CTk):
         self.set_status("✓ Found 1 matching reference!", "success")
         self._check_zotero_status()
     
-    def _show_search_results(self, results: List[Dict]):
+    def _show_search_results(self, results: List[Dict],
+                             lines: Optional[List[Tuple[str, str, str]]] = None):
         """Show the search results in a popup dialog."""
         self.set_status(f"Found {len(results)} matches - please select one", "info")
         
-        # Create dialog
-        dialog = SearchResultsDialog(self, results, callback=self._on_search_result_selected)
+        # Reuse the dialog from an earlier search if there is one
+        if self._results_dialog is not None and self._results_dialog.winfo_exists():
+            self._results_dialog.show_results(
+                results, self._on_search_result_selected, lines, dark=self._dark
+            )
+        else:
+            self._results_dialog = SearchResultsDialog(
+                self, results, callback=self._on_search_result_selected, lines=lines,
+                dark=self._dark
+            )
     
     def _on_search_result_selected(self, selected_item):
         """Handle search result selection."""
         if selected_item:
             bibtex = convert_to_bibtex(selected_item)
-            ris = convert_to_ris(selected_item)
             
             self.current_bibtex = bibtex
-            self.current_ris = ris
+            self.current_ris = None  # converted when first shown or copied
             self.current_doi = selected_item.get('DOI')
             self.current_crossref_data = selected_item
             
@@ -814,10 +1002,11 @@ class BibTexerApp(ctk.CTk):
             self.set_status("Selection cancelled", "info")
     
     def _update_output(self, text):
+        # Tk repaints on its next idle cycle; no forced update() needed
+        if self.output_text.get("1.0", "end-1c") == text:
+            return
         self.output_text.delete("1.0", "end")
         self.output_text.insert("1.0", text)
-        self.output_text.update()  # Force UI update
-        self.update_idletasks()  # Process pending events
     
     def set_status(self, message, status_type="info"):
         colors = {
@@ -827,7 +1016,7 @@ class BibTexerApp(ctk.CTk):
             "error": ("red", "#CC0000")
         }
         color = colors.get(status_type, colors["info"])
-        self.status_label.configure(text=message, text_color=color[1 if ctk.get_appearance_mode() == "Dark" else 0])
+        _set_label(self.status_label, message, color[1 if self._dark else 0])
     
     def copy_to_clipboard(self):
         """Copy current output (BibTeX or RIS) to clipboard."""
@@ -835,7 +1024,7 @@ class BibTexerApp(ctk.CTk):
             text_to_copy = self.current_bibtex
             format_name = "BibTeX"
         else:
-            text_to_copy = self.current_ris
+            text_to_copy = self._get_current_ris()
             format_name = "RIS"
         
         if text_to_copy:
@@ -855,36 +1044,36 @@ class BibTexerApp(ctk.CTk):
         self.oa_button.configure(state="disabled", text="Searching...")
         self.set_status("Searching Unpaywall for open access version...", "info")
         
-        # Run in thread to prevent GUI freeze
-        thread = threading.Thread(target=self._download_oa_thread)
-        thread.start()
+        # Run in a worker thread to prevent GUI freeze
+        self._submit(self._download_oa_thread)
     
     def _download_oa_thread(self):
         """Download open access paper in background thread."""
         try:
-            result = download_or_open_paper(
-                self.current_doi,
-                open_pdf=True,
-                fallback_browser=False  # Don't fall back - user can use Journal button
-            )
+            with report_retries(self._report_retry):
+                result = download_or_open_paper(
+                    self.current_doi,
+                    open_pdf=True,
+                    fallback_browser=False  # Don't fall back - user can use Journal button
+                )
             
             if result['success']:
-                self.after(0, lambda: self.set_status(f"✓ {result['message']}", "success"))
+                self._post_status(f"✓ {result['message']}", "success")
             elif result.get('pdf_url'):
                 # Found URL but couldn't download directly - open it
                 if open_url(result['pdf_url']):
-                    self.after(0, lambda: self.set_status(f"📄 Opened OA version in browser", "success"))
+                    self._post_status(f"📄 Opened OA version in browser", "success")
                 else:
-                    self.after(0, lambda: self.set_status(f"Found OA at: {result['pdf_url']}", "info"))
+                    self._post_status(f"Found OA at: {result['pdf_url']}", "info")
             else:
-                self.after(0, lambda: self.set_status(
+                self._post_status(
                     "No open access version found. Try '🏛️ Journal' for institutional access.", 
                     "warning"
-                ))
+                )
         except Exception as e:
-            self.after(0, lambda: self.set_status(f"Error: {e}", "error"))
+            self._post_status(f"Error: {e}", "error")
         finally:
-            self.after(0, lambda: self.oa_button.configure(state="normal", text="📄 Open Access"))
+            self._run_on_ui(self.oa_button.configure, state="normal", text="📄 Open Access")
     
     def open_journal_page(self):
         """Open the journal/publisher page via DOI URL (for institutional access)."""
@@ -895,10 +1084,16 @@ class BibTexerApp(ctk.CTk):
         doi_url = get_doi_url(self.current_doi)
         self.set_status(f"Opening {doi_url}...", "info")
         
+        # Launching the browser can take a while (e.g. on Windows), so do it
+        # in a worker thread
+        self._submit(self._open_journal_page_thread, doi_url)
+    
+    def _open_journal_page_thread(self, doi_url):
+        """Open the journal page in background thread."""
         if open_url(doi_url):
-            self.set_status(f"🏛️ Opened journal page - use institutional login if needed", "success")
+            self._post_status(f"🏛️ Opened journal page - use institutional login if needed", "success")
         else:
-            self.set_status(f"Couldn't open browser. URL: {doi_url}", "error")
+            self._post_status(f"Couldn't open browser. URL: {doi_url}", "error")
     
     def add_to_zotero(self):
         """Add current reference to Zotero via local connector."""
@@ -909,9 +1104,8 @@ class BibTexerApp(ctk.CTk):
         self.zotero_button.configure(state="disabled", text="Adding...")
         self.set_status("Sending to Zotero...", "info")
         
-        # Run in thread to prevent GUI freeze
-        thread = threading.Thread(target=self._add_to_zotero_thread)
-        thread.start()
+        # Run in a worker thread to prevent GUI freeze
+        self._submit(self._add_to_zotero_thread)
     
     def _add_to_zotero_thread(self):
         """Add to Zotero in background thread."""
@@ -919,14 +1113,14 @@ class BibTexerApp(ctk.CTk):
             success, message = send_to_zotero_local(self.current_crossref_data)
             
             if success:
-                self.after(0, lambda: self.set_status(f"✓ {message}", "success"))
+                self._post_status(f"✓ {message}", "success")
             else:
-                self.after(0, lambda: self.set_status(f"⚠ {message}", "warning"))
+                self._post_status(f"⚠ {message}", "warning")
         except Exception as e:
-            self.after(0, lambda: self.set_status(f"Error: {e}", "error"))
+            self._post_status(f"Error: {e}", "error")
         finally:
-            self.after(0, lambda: self.zotero_button.configure(state="normal", text="📚 Add to Zotero"))
-            self.after(0, self._check_zotero_status)
+            self._run_on_ui(self.zotero_button.configure, state="normal", text="📚 Add to Zotero")
+            self._run_on_ui(self._check_zotero_status)
     
     def clear_all(self):
         self.doi_entry.delete(0, "end")
@@ -938,6 +1132,32 @@ class BibTexerApp(ctk.CTk):
         self.current_doi = None
         self.current_crossref_data = None
         self.set_status("", "info")
+    
+    def refresh_lookups(self):
+        """Forget remembered lookups and fetch the entered DOI again from CrossRef."""
+        doi = self.doi_entry.get().strip()
+        clear_lookup_caches(clean_doi(doi) if doi else None)
+        self._prefetched_doi = None
+        if doi:
+            self.convert_doi()
+        else:
+            self.set_status("Cached lookups cleared", "info")
+    
+    def _on_close(self):
+        """
+        Stop accepting background work and close the window.
+        
+        Jobs that have not started yet, including queued Unpaywall
+        prefetches, are cancelled. Requests already in flight cannot be
+        interrupted: the process exits once they return (at most the network
+        timeout), and their UI updates are dropped.
+        """
+        self._closed = True
+        for future in list(self._pending_jobs):
+            future.cancel()
+        cancel_prefetches()
+        self._executor.shutdown(wait=False)
+        self.destroy()
 
 
 def main():
@@ -8,6 +8,7 @@ Copyright (c) 2026 Erik Bitzek
 Usage: 
   doi2bib.py <doi>                    # Lookup by DOI (BibTeX output)
   doi2bib.py --ris <doi>              # Lookup by DOI (RIS output)
+  doi2bib.py <doi> <doi> ...          # Lookup several DOIs at once
   doi2bib.py --search "<reference>"   # Search by reference text
   doi2bib.py --zotero <doi>           # Add directly to Zotero
 
@@ -26,6 +27,7 @@ from bibtexer_core import (
     __project__,
     clean_doi,
     get_crossref_data,
+    get_crossref_data_batch,
     search_crossref,
     convert_to_bibtex,
     convert_to_ris,
@@ -47,6 +49,7 @@ def print_usage():
     print("", file=sys.stderr)
     print("Usage:", file=sys.stderr)
     print("  doi2bib.py <doi>                    # Lookup by DOI (BibTeX output)", file=sys.stderr)
+    print("  doi2bib.py <doi> <doi> ...          # Lookup several DOIs at once", file=sys.stderr)
     print('  doi2bib.py --search "<reference>"   # Search by reference text', file=sys.stderr)
     print("  doi2bib.py --ris <doi>              # Output in RIS format", file=sys.stderr)
     print("  doi2bib.py --zotero <doi>           # Add directly to local Zotero", file=sys.stderr)
@@ -182,6 +185,45 @@ def handle_doi(doi: str, output_ris: bool = False):
         sys.exit(1)
 
 
+def handle_dois(dois: list, output_ris: bool = False):
+    """Handle lookup of several DOIs (batched CrossRef requests)."""
+    dois = [clean_doi(doi) for doi in dois]
+    
+    try:
+        records = get_crossref_data_batch(dois)
+        
+        found = []
+        for doi in dois:
+            data = records.get(doi)
+            if data is None:
+                print(f"⚠ DOI not found: {doi}", file=sys.stderr)
+                continue
+            found.append(data)
+        
+        converter = convert_to_ris if output_ris else convert_to_bibtex
+        outputs = [converter(data) for data in found]
+        
+        if not outputs:
+            sys.exit(1)
+        
+        format_name = "RIS" if output_ris else "BibTeX"
+        output = '\n\n'.join(outputs)
+        print(output)
+        
+        if copy_to_clipboard(output):
+            print(f"\n✓ {len(outputs)} {format_name} entries copied to clipboard!", file=sys.stderr)
+        else:
+            print("\n⚠ Could not copy to clipboard", file=sys.stderr)
+        
+        return records
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Unexpected error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def handle_zotero(doi: str):
     """Handle adding reference to local Zotero."""
     doi = clean_doi(doi)
@@ -340,6 +382,10 @@ def main():
         print_usage()
         sys.exit(1)
     
+    elif len(args) > 1:
+        # Multiple DOIs - fetched in batches
+        handle_dois(args, output_ris=output_ris)
+    
     else:
         # DOI mode
         handle_doi(args[0], output_ris=output_ris)